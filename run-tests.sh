@@ -320,7 +320,7 @@ if [ "$SKIP_E2E" = false ]; then
         E2E_TARGET=("tests/e2e")
     fi
 
-    # Headed mode: run sequentially (override -n auto from pytest.ini)
+    # Headed mode: run sequentially (override -n 7 from pytest.ini)
     if [[ "$*" == *"--headed"* ]]; then
         pytest "${E2E_TARGET[@]}" $BROWSER_ARGS -n 0 "$@"
     else
@@ -3,165 +3,122 @@
 Usage:
     python scripts/capture_screenshots.py --port 3001
     python scripts/capture_screenshots.py --port 3001 --only menu,og
+    python scripts/capture_screenshots.py --port 3001 --fast   # JPEG previews, not for commit
 """
 import argparse
+import asyncio
+import base64
 import json
-import time
-from playwright.sync_api import sync_playwright
+import os
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError, async_playwright
 
 VP = {"width": 1280, "height": 720}
 OG_VP = {"width": 1200, "height": 630}
 
-# Full progress with currentLevel beyond LEVELS array so MenuScene uses randomMood
-FULL_PROGRESS = json.dumps({
-    "currentLevel": 99,
-    "levelStats": {
-        str(i): {"completed": True, "bestStars": 3, "bestTime": 120 + i * 20, "bestBonusMet": 2}
-        for i in range(11)
-    },
-    "savedAt": "2026-02-21T08:00:00Z",
-})
-
-SETUP_JS = """(progress) => {
-    localStorage.setItem('snowGroomer_progress', progress);
-    localStorage.setItem('snowGroomer_tutorialDone', '1');
-    localStorage.setItem('snowGroomer_prologueSeen', '1');
-    localStorage.setItem('snowGroomer_audioMuted', 'true');
-}"""
-
-
-DISMISS_DIALOGUE_JS = """() => {
-    const ds = window.game.scene.getScene('DialogueScene');
-    if (ds && window.game.scene.isActive('DialogueScene')) ds.scene.stop();
-}"""
-
-
-def dismiss_dialogue(page):
-    """Stop DialogueScene if active."""
-    page.evaluate(DISMISS_DIALOGUE_JS)
-    time.sleep(0.3)
-
-
-def wait_scene(page, name, timeout=15000):
-    page.wait_for_function(
-        f"window.game?.scene?.isActive('{name}')", timeout=timeout)
-    time.sleep(0.5)
-
-
-def setup_page(context, url, extra_storage=None):
-    """Create page with full progress and muted audio."""
-    page = context.new_page()
-    page.goto(url)
-    page.evaluate(SETUP_JS, FULL_PROGRESS)
-    if extra_storage:
-        for k, v in extra_storage.items():
-            page.evaluate(f"() => localStorage.setItem('{k}', '{v}')")
-    page.reload()
-    wait_scene(page, "MenuScene", timeout=20000)
-    return page
+# Captures run concurrently, one browser context each. Chromium starts
+# thrashing well before ~10 parallel renderers, so keep the pool small.
+MAX_PARALLEL = 4
+
+# Scene switches on a warm dev server take well under a second; fail fast
+# instead of hiding regressions behind long waits. Only the cold first boot
+# of each page (COLD_BOOT_TIMEOUT) gets more.
+DEFAULT_TIMEOUT = 5000
+COLD_BOOT_TIMEOUT = 20000
+
+# Offscreen capture job: don't pace frames to vsync or throttle hidden pages
+CHROMIUM_ARGS = [
+    "--disable-gpu-vsync",
+    "--disable-frame-rate-limit",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+    "--disable-features=CalculateNativeWinOcclusion",
+]
+
+# The game only needs its own bundle and assets; fonts are system fonts and
+# audio is muted, so anything else is load time we don't need.
+BLOCKED_RESOURCE_TYPES = frozenset({"font", "media"})
+
+# Alive light-snow particles before the menu counts as "filled" (emitter
+# spawns ~10/s with a 5s lifespan, so steady state is ~50).
+MENU_SNOW_PARTICLES = 40
+
+# Full progress with currentLevel beyond LEVELS array so MenuScene uses randomMood.
+# Pre-serialized: levels 0-10 all completed, 3 stars, bestTime 120 + 20*i, 2 bonuses.
+FULL_PROGRESS = (
+    '{"currentLevel":99,"levelStats":{'
+    '"0":{"completed":true,"bestStars":3,"bestTime":120,"bestBonusMet":2},'
+    '"1":{"completed":true,"bestStars":3,"bestTime":140,"bestBonusMet":2},'
+    '"2":{"completed":true,"bestStars":3,"bestTime":160,"bestBonusMet":2},'
+    '"3":{"completed":true,"bestStars":3,"bestTime":180,"bestBonusMet":2},'
+    '"4":{"completed":true,"bestStars":3,"bestTime":200,"bestBonusMet":2},'
+    '"5":{"completed":true,"bestStars":3,"bestTime":220,"bestBonusMet":2},'
+    '"6":{"completed":true,"bestStars":3,"bestTime":240,"bestBonusMet":2},'
+    '"7":{"completed":true,"bestStars":3,"bestTime":260,"bestBonusMet":2},'
+    '"8":{"completed":true,"bestStars":3,"bestTime":280,"bestBonusMet":2},'
+    '"9":{"completed":true,"bestStars":3,"bestTime":300,"bestBonusMet":2},'
+    '"10":{"completed":true,"bestStars":3,"bestTime":320,"bestBonusMet":2}'
+    '},"savedAt":"2026-02-21T08:00:00Z"}'
+)
+
+SETUP_STORAGE = {
+    "snowGroomer_progress": FULL_PROGRESS,
+    "snowGroomer_tutorialDone": "1",
+    "snowGroomer_prologueSeen": "1",
+    "snowGroomer_audioMuted": "true",
+}
 
 
-def force_menu_weather(page, is_night, weather):
-    """Restart MenuScene with specific weather mood."""
-    page.evaluate(f"""() => {{
+# Capture-side game manipulation, installed once per context as window.__cap
+# so each capture's evaluate is a one-line call instead of a fresh script.
+CAPTURE_HELPERS_JS = """window.__cap = {
+    // Resolve once pred() holds, or after maxMs regardless (checked every frame)
+    waitFor(pred, maxMs) {
+        const deadline = performance.now() + maxMs;
+        return new Promise(resolve => {
+            const check = () => {
+                if (pred() || performance.now() >= deadline) resolve();
+                else requestAnimationFrame(check);
+            };
+            check();
+        });
+    },
+    // Restart MenuScene with a fixed weather mood
+    forceMenuWeather(isNight, weather) {
         const menu = window.game.scene.getScene('MenuScene');
-        menu.pickRandomMenuMood = () => ({{ isNight: {str(is_night).lower()}, weather: '{weather}' }});
+        menu.pickRandomMenuMood = () => ({ isNight, weather });
         menu.randomMood = null;
-        menu.scene.restart();
-    }}""")
-    wait_scene(page, "MenuScene")
-
-
-def capture_menu(context, url, assets):
-    """Menu with night + light snow."""
-    page = setup_page(context, url)
-    force_menu_weather(page, True, "light_snow")
-    time.sleep(5)  # let snow particles fill the screen
-    page.screenshot(path=f"{assets}/screenshot-menu.png")
-    print("✓ screenshot-menu.png")
-    page.close()
-
-
-def capture_og(context, url, public):
-    """Open Graph image: light weather menu at 1200×630."""
-    browser = context.browser
-    og_context = browser.new_context(viewport=OG_VP, device_scale_factor=1)
-    try:
-        page = og_context.new_page()
-        page.goto(url)
-        page.evaluate(SETUP_JS, FULL_PROGRESS)
-        page.reload()
-        wait_scene(page, "MenuScene", timeout=20000)
-        force_menu_weather(page, False, "clear")
-        time.sleep(3)
-        page.screenshot(path=f"{public}/og-image.png")
-        print("✓ og-image.png")
-        page.close()
-    finally:
-        og_context.close()
-
-
-def capture_trail_map(context, url, assets):
-    """Trail map (LevelSelectScene)."""
-    page = setup_page(context, url)
-    page.evaluate("""() => {
-        window.game.scene.stop('MenuScene');
-        window.game.scene.start('LevelSelectScene');
-    }""")
-    wait_scene(page, "LevelSelectScene")
-    time.sleep(2)
-    page.screenshot(path=f"{assets}/screenshot-trailmap.png")
-    print("✓ screenshot-trailmap.png")
-    page.close()
-
-
-def capture_daily_runs(context, url, assets):
-    """Daily Runs scene."""
-    page = setup_page(context, url)
-    page.evaluate("""() => {
-        window.game.scene.stop('MenuScene');
-        window.game.scene.start('DailyRunsScene');
-    }""")
-    wait_scene(page, "DailyRunsScene")
-    time.sleep(2)
-    page.screenshot(path=f"{assets}/screenshot-dailyruns.png")
-    print("✓ screenshot-dailyruns.png")
-    page.close()
-
-
-def capture_gameplay(context, url, assets):
-    """Groomer mid-piste with natural zigzag grooming pattern."""
-    page = setup_page(context, url)
-    # Use level 2 (blue piste — clean terrain, good visual contrast)
-    page.evaluate("""() => {
-        window.game.scene.stop('MenuScene');
-        window.game.scene.start('GameScene', { level: 2 });
-    }""")
-    wait_scene(page, "GameScene")
-    time.sleep(1.5)
-
-    dismiss_dialogue(page)
-
-    # Simulate natural top-down grooming — 3 completed passes + groomer on 4th
-    page.evaluate("""() => {
-        const gs = window.game.scene.getScene('GameScene');
+        for (const s of window.game.scene.getScenes(true)) s.scene.stop();
+        window.game.scene.start('MenuScene');
+    },
+    // Simulate natural top-down grooming — 3 completed passes + groomer on 4th
+    groomGameplay(gs) {
         const ts = gs.tileSize;
-        const midY = Math.floor(gs.level.height * 0.50);
+        const w = gs.level.width, h = gs.level.height;
+        const midY = Math.floor(h * 0.50);
         const texKey = 'snow_groomed' + gs.nightSfx;
 
-        // Find groomable left/right bounds per row
-        const bounds = [];
-        for (let y = 0; y < gs.level.height; y++) {
-            let minX = gs.level.width, maxX = 0;
-            for (let x = 0; x < gs.level.width; x++) {
-                if (gs.snowGrid[y]?.[x]?.groomable) {
-                    minX = Math.min(minX, x);
-                    maxX = Math.max(maxX, x);
+        // Groomable left/right bounds per row (-1 = no piste on that row)
+        const left = new Int16Array(h).fill(-1);
+        const right = new Int16Array(h).fill(-1);
+        for (let y = 0; y < h; y++) {
+            const row = gs.snowGrid[y];
+            if (!row) continue;
+            let minX = w, maxX = 0;
+            for (let x = 0; x < w; x++) {
+                if (row[x].groomable) {
+                    if (x < minX) minX = x;
+                    maxX = x;
                 }
             }
-            bounds.push(minX < maxX ? { left: minX, right: maxX } : null);
+            if (minX < maxX) { left[y] = minX; right[y] = maxX; }
         }
 
+        // Groomed tiles are collected as x,y pairs and stamped in one batch
+        const stamped = new Uint16Array(w * h * 2);
+        let stampCount = 0;
+
         // 3 completed passes (full height) + 4th pass in progress (to midY)
         // Passes are adjacent like real grooming — side by side from the left
         const stripHalf = 2;
@@ -179,16 +136,18 @@ def capture_gameplay(context, url, assets):
 
         function groomPass(passIndex, startFrac, endY) {
             const dp = driftParams[passIndex];
+            const drift = new Float32Array(endY);
+            for (let y = 0; y < endY; y++) {
+                drift[y] = dp.a1 * Math.sin(y * dp.f1 + dp.phase)
+                         + dp.a2 * Math.sin(y * dp.f2 + dp.phase + 0.7);
+            }
             let lastCx = 0;
             for (let y = 0; y < endY; y++) {
-                const b = bounds[y];
-                if (!b) continue;
-                const pisteW = b.right - b.left;
+                if (left[y] < 0) continue;
+                const pisteW = right[y] - left[y];
                 if (pisteW < 8) continue;
 
-                const drift = dp.a1 * Math.sin(y * dp.f1 + dp.phase)
-                             + dp.a2 * Math.sin(y * dp.f2 + dp.phase + 0.7);
-                lastCx = Math.round(b.left + startFrac * pisteW + drift);
+                lastCx = Math.round(left[y] + startFrac * pisteW + drift[y]);
 
                 for (let x = lastCx - stripHalf; x <= lastCx + stripHalf; x++) {
                     const cell = gs.snowGrid[y]?.[x];
@@ -196,15 +155,17 @@ def capture_gameplay(context, url, assets):
                     cell.groomed = true;
                     cell.quality = 0.8;
                     gs.groomedCount++;
-                    gs.stampPisteTile(texKey, x, y);
+                    stamped[2 * stampCount] = x;
+                    stamped[2 * stampCount + 1] = y;
+                    stampCount++;
                 }
             }
             return lastCx; // last center tile X
         }
 
         // Compute starting fractions: start from left edge of piste
-        const sampleB = bounds[Math.floor(midY / 2)];
-        const medianW = sampleB ? sampleB.right - sampleB.left : 25;
+        const sampleY = Math.floor(midY / 2);
+        const medianW = left[sampleY] >= 0 ? right[sampleY] - left[sampleY] : 25;
         const strideFrac = stride / medianW;
         const startAt = 0.08;
 
@@ -213,6 +174,7 @@ def capture_gameplay(context, url, assets):
         groomPass(1, startAt + strideFrac, gs.level.height);
         groomPass(2, startAt + strideFrac * 2, gs.level.height);
         const pass4LastX = groomPass(3, startAt + strideFrac * 3, midY);
+        gs.stampPisteTiles(texKey, stamped, stampCount);
 
         // Position groomer exactly at the tip of the 4th pass
         gs.groomer.setPosition(pass4LastX * ts, (midY - 1) * ts);
@@ -224,72 +186,33 @@ def capture_gameplay(context, url, assets):
         gs.timeRemaining = Math.max(90, gs.level.timeLimit * 0.5);
 
         // Center camera on piste
-        const mb = bounds[midY];
-        if (mb) {
-            const pisteCenterX = Math.round((mb.left + mb.right) / 2) * ts;
+        if (left[midY] >= 0) {
+            const pisteCenterX = Math.round((left[midY] + right[midY]) / 2) * ts;
             gs.cameras.main.centerOn(pisteCenterX, midY * ts);
         }
-    }""")
-    time.sleep(0.3)
-
-    page.screenshot(path=f"{assets}/screenshot-gameplay.png")
-    print("✓ screenshot-gameplay.png")
-    page.close()
-
-
-def capture_level_complete(context, url, assets):
-    """Win screen with realistic stats."""
-    page = setup_page(context, url)
-    page.evaluate("""() => {
-        window.game.scene.stop('MenuScene');
-        window.game.scene.start('GameScene', { level: 5 });
-    }""")
-    wait_scene(page, "GameScene")
-    time.sleep(1)
-
-    dismiss_dialogue(page)
-
-    page.evaluate("""() => {
-        const gs = window.game.scene.getScene('GameScene');
-        const texKey = 'snow_groomed' + gs.nightSfx;
-        for (let y = 0; y < gs.level.height; y++) {
-            for (let x = 0; x < gs.level.width; x++) {
-                const cell = gs.snowGrid[y]?.[x];
-                if (cell?.groomable && !cell.groomed && Math.random() < 0.92) {
-                    cell.groomed = true;
-                    cell.quality = 0.8;
-                    gs.groomedCount++;
-                    gs.stampPisteTile(texKey, x, y);
-                }
-            }
-        }
+    },
+    // Win the current level with realistic stats
+    finishLevel(gs) {
+        // Only the stats reach LevelCompleteScene (the piste is never on
+        // screen), so set coverage from the counters, not per tile
+        gs.groomedCount = Math.floor(gs.totalTiles * 0.92);
         gs.timeRemaining = gs.level.timeLimit - 245;
         gs.fuelUsed = 40;
         gs.gameOver(true);
-    }""")
-    wait_scene(page, "LevelCompleteScene")
-    time.sleep(2)
-    page.screenshot(path=f"{assets}/screenshot-level.png")
-    print("✓ screenshot-level.png")
-    page.close()
-
-
-def capture_ski_trick(context, url, assets):
-    """Ski trick on park kicker."""
-    page = setup_page(context, url, extra_storage={"snowGroomer_skiMode": "ski"})
-    page.evaluate("""() => {
-        window.game.scene.stop('MenuScene');
-        window.game.scene.start('GameScene', { level: 3 });
-    }""")
-    wait_scene(page, "GameScene")
-    time.sleep(1)
-
-    page.keyboard.press("k")
-    wait_scene(page, "SkiRunScene", timeout=10000)
-    time.sleep(1.5)
-
-    page.evaluate("""() => {
+    },
+    // Stage the whole ski trick in one round trip: trigger, lift, freeze pose.
+    // Resolves to whether the trick fired.
+    async skiTrick() {
         const ski = window.game.scene.getScene('SkiRunScene');
+        await this.waitFor(() => ski.skier && ski.parkFeatures?.featureGroup, 1500);
+        if (!this.startSkiTrick(ski)) return false;
+        // Let the launch tween lift the skier before freezing the pose
+        await this.waitFor(() => ski.skier.scaleX >= (ski.tileSize / 16) * 1.25, 500);
+        this.poseSkiTrick(ski);
+        return true;
+    },
+    // Trigger the kicker trick directly instead of steering into it with the keyboard
+    startSkiTrick(ski) {
         // parkFeatures.featureGroup is a Phaser Group, not an array
         let kicker = null;
         const fg = ski.parkFeatures?.featureGroup;
@@ -298,60 +221,236 @@ def capture_ski_trick(context, url, assets):
                 if (child.texture?.key === 'park_kicker') { kicker = child; break; }
             }
         }
-        const origRandom = Math.random;
-        let callCount = 0;
-        Math.random = function() {
-            callCount++;
-            if (callCount === 1) return 0.3;
-            return origRandom();
-        };
-        setTimeout(() => { Math.random = origRandom; }, 2000);
         if (kicker) {
             ski.skier.setPosition(kicker.x, kicker.y - 10);
         } else {
             ski.skier.setPosition(ski.skier.x, ski.skier.y + 200);
         }
         ski.currentSpeed = 25;
-    }""")
-
-    page.keyboard.down("ArrowDown")
-    time.sleep(0.3)
-
-    trick_active = False
-    for _ in range(20):
-        trick_active = page.evaluate("""() => {
-            const ski = window.game.scene.getScene('SkiRunScene');
-            return ski.trickActive === true;
-        }""")
-        if trick_active:
-            break
-        time.sleep(0.1)
-    page.keyboard.up("ArrowDown")
-
-    if trick_active:
-        page.evaluate("""() => {
-            const ski = window.game.scene.getScene('SkiRunScene');
-            ski.scene.pause();
-            const ts = ski.tileSize || 16;
-            const baseScale = ski.skier.scaleX;
-            ski.skier.y -= ts * 1.5;
-            ski.skier.setScale(baseScale * 1.5);
-            ski.skier.setAngle(430);
-            ski.skier.setDepth(150);
-            if (ski.trickText) {
-                ski.trickText.setAlpha(1);
-                ski.trickText.setDepth(200);
-                ski.trickText.setPosition(ski.skier.x, ski.skier.y - 40);
-            }
-        }""")
-        time.sleep(0.3)
-    else:
+        // Pin the trick roll to the 720
+        const origRandom = Math.random;
+        Math.random = () => 0.3;
+        try {
+            ski.onFeatureTrick('kicker');
+        } finally {
+            Math.random = origRandom;
+        }
+        return ski.trickActive === true;
+    },
+    // Freeze the skier mid-trick, airborne above the kicker
+    poseSkiTrick(ski) {
+        ski.scene.pause();
+        const ts = ski.tileSize || 16;
+        const baseScale = ski.skier.scaleX;
+        ski.skier.y -= ts * 1.5;
+        ski.skier.setScale(baseScale * 1.5);
+        ski.skier.setAngle(430);
+        ski.skier.setDepth(150);
+        if (ski.trickText) {
+            ski.trickText.setAlpha(1);
+            ski.trickText.setDepth(200);
+            ski.trickText.setPosition(ski.skier.x, ski.skier.y - 40);
+        }
+    },
+};"""
+
+
+# Resolves once the scene manager has processed the stop (double rAF)
+DISMISS_DIALOGUE_JS = """async () => {
+    const ds = window.game.scene.getScene('DialogueScene');
+    if (!ds || !window.game.scene.isActive('DialogueScene')) return;
+    ds.scene.stop();
+    await new Promise(r => requestAnimationFrame(() => requestAnimationFrame(r)));
+}"""
+
+
+async def dismiss_dialogue(page):
+    """Stop DialogueScene if active."""
+    await page.evaluate(DISMISS_DIALOGUE_JS)
+
+
+SWITCH_SCENE_JS = """([key, data]) => {
+    for (const s of window.game.scene.getScenes(true)) s.scene.stop();
+    window.game.scene.start(key, data);
+}"""
+
+WAIT_FRAMES_JS = """(n) => new Promise(resolve => {
+    const step = () => (--n <= 0 ? resolve() : requestAnimationFrame(step));
+    requestAnimationFrame(step);
+})"""
+
+INTRO_DIALOGUE_SETTLED_JS = """() => {
+    const gs = window.game.scene.getScene('GameScene');
+    if (!gs?.level?.introDialogue) return true;
+    return window.game.scene.getScene('DialogueScene')?.isDialogueShowing?.() === true;
+}"""
+
+
+async def wait_frames(page, n=2):
+    """Wait until the game has rendered n more frames."""
+    await page.evaluate(WAIT_FRAMES_JS, n)
+
+
+async def settle(page, predicate, max_wait, arg=None):
+    """Wait for a game-state predicate, bounded by the old fixed delay (seconds).
+
+    On timeout we capture anyway, exactly as the fixed delay used to.
+    """
+    try:
+        await page.wait_for_function(predicate, arg=arg, timeout=max_wait * 1000)
+    except PlaywrightTimeoutError:
+        pass
+
+
+def _write_image(path, b64_data):
+    with open(path, "wb") as f:
+        f.write(base64.b64decode(b64_data))
+    print(f"✓ {os.path.basename(path)}")
+
+
+async def save_screenshot(cdp, path, fast, pool):
+    """Grab the viewport straight from the compositor surface via CDP.
+
+    Skips Playwright's screenshot pipeline (which waits for a fresh paint
+    after scale/angle changes) and zlib's slow max-compression pass.
+    Decode + write run on `pool` so the next capture can start navigating;
+    returns the awaitable write, which reports the file once it is on disk.
+    With `fast`, writes a quick JPEG preview next to the PNG instead.
+    """
+    params = {
+        "format": "png",
+        "fromSurface": True,
+        "captureBeyondViewport": False,
+        "optimizeForSpeed": True,
+    }
+    if fast:
+        path = os.path.splitext(path)[0] + ".jpg"
+        params.update(format="jpeg", quality=90)
+    shot = await cdp.send("Page.captureScreenshot", params)
+    return asyncio.get_running_loop().run_in_executor(pool, _write_image, path, shot["data"])
+
+
+async def scene_handle(page, name):
+    """JSHandle to a scene, so follow-up evaluates skip the scene manager lookup."""
+    return await page.evaluate_handle("(name) => window.game.scene.getScene(name)", name)
+
+
+async def wait_scene(page, name, timeout=None):
+    await page.wait_for_function(
+        f"window.game?.scene?.isActive('{name}')", timeout=timeout)
+    await wait_frames(page)
+
+
+def storage_init_script(extra_storage=None):
+    """Init script writing localStorage before any game code runs on each load."""
+    items = {**SETUP_STORAGE, **(extra_storage or {})}
+    return "\n".join(
+        f"localStorage.setItem({json.dumps(k)}, {json.dumps(v)});"
+        for k, v in items.items()
+    )
+
+
+async def setup_page(context, url):
+    """Create page booted to MenuScene (storage already seeded by the context)."""
+    page = await context.new_page()
+    await page.goto(url)
+    await wait_scene(page, "MenuScene", timeout=COLD_BOOT_TIMEOUT)
+    return page
+
+
+async def switch_scene(page, key, data=None):
+    """Stop whatever the previous capture left running and start `key` directly.
+
+    Going straight from one capture's scene to the next (no MenuScene in
+    between) keeps e.g. GameScene warm from gameplay into level complete.
+    """
+    await page.evaluate(SWITCH_SCENE_JS, [key, data or {}])
+    await wait_scene(page, key)
+
+
+async def force_menu_weather(page, is_night, weather):
+    """Restart MenuScene with specific weather mood."""
+    await page.evaluate(
+        "([isNight, weather]) => window.__cap.forceMenuWeather(isNight, weather)",
+        [is_night, weather])
+    await wait_scene(page, "MenuScene")
+
+
+async def capture_menu(page, assets, save):
+    """Menu with night + light snow."""
+    await force_menu_weather(page, True, "light_snow")
+    # Let snow particles fill the screen
+    await settle(page, f"""() => {{
+        const menu = window.game.scene.getScene('MenuScene');
+        const snow = menu.children.list.find(c => c.type === 'ParticleEmitter');
+        return snow?.getAliveParticleCount() >= {MENU_SNOW_PARTICLES};
+    }}""", max_wait=5)
+    await save(f"{assets}/screenshot-menu.png")
+
+
+async def capture_og(page, public, save):
+    """Open Graph image: light weather menu at 1200×630."""
+    await force_menu_weather(page, False, "clear")
+    await save(f"{public}/og-image.png")
+
+
+async def capture_trail_map(page, assets, save):
+    """Trail map (LevelSelectScene)."""
+    await switch_scene(page, "LevelSelectScene")
+    await settle(page, "() => window.game.scene.getScene('LevelSelectScene').inputReady", max_wait=2)
+    await save(f"{assets}/screenshot-trailmap.png")
+
+
+async def capture_daily_runs(page, assets, save):
+    """Daily Runs scene."""
+    await switch_scene(page, "DailyRunsScene")
+    await save(f"{assets}/screenshot-dailyruns.png")
+
+
+async def capture_gameplay(page, assets, save):
+    """Groomer mid-piste with natural zigzag grooming pattern."""
+    # Use level 2 (blue piste — clean terrain, good visual contrast)
+    await switch_scene(page, "GameScene", {"level": 2})
+    await settle(page, INTRO_DIALOGUE_SETTLED_JS, max_wait=1.5)
+
+    await dismiss_dialogue(page)
+
+    # Simulate natural top-down grooming — 3 completed passes + groomer on 4th
+    gs = await scene_handle(page, "GameScene")
+    await page.evaluate("(gs) => window.__cap.groomGameplay(gs)", gs)
+    await gs.dispose()
+    await wait_frames(page)  # HUD picks up fuel/stamina on the next GAME_STATE
+
+    await save(f"{assets}/screenshot-gameplay.png")
+
+
+async def capture_level_complete(page, assets, save):
+    """Win screen with realistic stats."""
+    await switch_scene(page, "GameScene", {"level": 5})
+    await settle(page, INTRO_DIALOGUE_SETTLED_JS, max_wait=1)
+
+    await dismiss_dialogue(page)
+
+    gs = await scene_handle(page, "GameScene")
+    await page.evaluate("(gs) => window.__cap.finishLevel(gs)", gs)
+    await gs.dispose()
+    await wait_scene(page, "LevelCompleteScene")
+    await settle(page, "() => window.game.scene.getScene('LevelCompleteScene').inputReady", max_wait=2)
+    await save(f"{assets}/screenshot-level.png")
+
+
+async def capture_ski_trick(page, assets, save):
+    """Ski trick on park kicker."""
+    await switch_scene(page, "GameScene", {"level": 3})
+
+    await page.keyboard.press("k")
+    await wait_scene(page, "SkiRunScene")
+
+    if not await page.evaluate("() => window.__cap.skiTrick()"):
         print("  ⚠ trick didn't trigger, capturing anyway")
-        time.sleep(0.5)
+    await wait_frames(page)
 
-    page.screenshot(path=f"{assets}/screenshot-ski.png")
-    print("✓ screenshot-ski.png")
-    page.close()
+    await save(f"{assets}/screenshot-ski.png")
 
 
 ALL_CAPTURES = {
@@ -361,37 +460,101 @@ ALL_CAPTURES = {
     "gameplay": capture_gameplay,
     "level": capture_level_complete,
     "ski": capture_ski_trick,
+    "og": capture_og,
 }
+ALL_TARGETS = frozenset(ALL_CAPTURES)
+
+# Output directory per target (relative to the repo root)
+OUTPUT_DIRS = {"og": "public"}
+DEFAULT_OUTPUT_DIR = "assets"
+
+# Targets whose boot state differs from the default need their own page:
+# name -> (viewport, extra localStorage). Everything else shares one warm
+# page and just switches scenes.
+OWN_CONTEXT = {
+    "ski": (VP, {"snowGroomer_skiMode": "ski"}),
+    "og": (OG_VP, None),
+}
+
+
+def block_nonessential(game_host):
+    """Route handler aborting third-party and font/media requests."""
+    async def handler(route):
+        request = route.request
+        if (request.resource_type in BLOCKED_RESOURCE_TYPES
+                or urlparse(request.url).netloc != game_host):
+            await route.abort()
+        else:
+            await route.continue_()
+    return handler
+
+
+async def run_captures(browser, semaphore, names, url, root, fast, pool,
+                       viewport=VP, extra_storage=None):
+    """Boot one page in its own context and run captures on it back to back.
+
+    Separate contexts keep parallel groups from blocking each other.
+    """
+    async with semaphore:
+        context = await browser.new_context(viewport=viewport, device_scale_factor=1)
+        context.set_default_timeout(DEFAULT_TIMEOUT)
+        await context.add_init_script(storage_init_script(extra_storage))
+        await context.add_init_script(CAPTURE_HELPERS_JS)
+        await context.route("**/*", block_nonessential(urlparse(url).netloc))
+        writes = []
+        try:
+            page = await setup_page(context, url)
+            cdp = await context.new_cdp_session(page)
+
+            async def save(path):
+                writes.append(await save_screenshot(cdp, path, fast, pool))
+
+            for name in names:
+                out_dir = os.path.join(root, OUTPUT_DIRS.get(name, DEFAULT_OUTPUT_DIR))
+                await ALL_CAPTURES[name](page, out_dir, save)
+        finally:
+            await context.close()
+            await asyncio.gather(*writes)  # re-raise any write error
+
+
+async def capture_all(targets, url, root, fast, pool):
+    shared = [n for n in targets if n not in OWN_CONTEXT]
+    jobs = [([n], *OWN_CONTEXT[n]) for n in targets if n in OWN_CONTEXT]
+    if shared:
+        jobs.insert(0, (shared, VP, None))
+
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True, args=CHROMIUM_ARGS)
+        semaphore = asyncio.Semaphore(MAX_PARALLEL)
+        try:
+            await asyncio.gather(*(
+                run_captures(browser, semaphore, names, url, root, fast, pool, viewport, storage)
+                for names, viewport, storage in jobs
+            ))
+        finally:
+            await browser.close()
 
 
 def main():
     parser = argparse.ArgumentParser(description="Capture documentation screenshots")
     parser.add_argument("--port", type=int, default=3000)
     parser.add_argument("--only", help="Comma-separated list: menu,trailmap,dailyruns,gameplay,level,ski,og")
+    parser.add_argument("--fast", action="store_true",
+                        help="Write JPEG previews (.jpg) instead of the shipped PNGs")
     args = parser.parse_args()
 
-    import os
     root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    assets = os.path.join(root, "assets")
-    public = os.path.join(root, "public")
     url = f"http://localhost:{args.port}/"
 
-    targets = args.only.split(",") if args.only else list(ALL_CAPTURES.keys()) + ["og"]
+    targets = args.only.split(",") if args.only else list(ALL_CAPTURES)
+    for name in targets:
+        if name not in ALL_TARGETS:
+            print(f"⚠ Unknown target: {name}")
+    targets = [name for name in targets if name in ALL_TARGETS]
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        context = browser.new_context(viewport=VP, device_scale_factor=1)
-        try:
-            for name in targets:
-                if name == "og":
-                    capture_og(context, url, public)
-                elif name in ALL_CAPTURES:
-                    ALL_CAPTURES[name](context, url, assets)
-                else:
-                    print(f"⚠ Unknown target: {name}")
-        finally:
-            context.close()
-            browser.close()
+    # Image decode + write happen off the event loop; two threads keep up
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        asyncio.run(capture_all(targets, url, root, args.fast, pool))
 
     print(f"\n✅ {len(targets)} screenshot(s) captured!")
 
@@ -131,6 +131,7 @@ export default class GameScene extends Phaser.Scene {
   private boundaryWalls!: Phaser.Physics.Arcade.StaticGroup;
   private snowGrid: SnowCell[][] = [];
   private pisteDynTex!: Phaser.Textures.DynamicTexture;
+  private stampPair = [0, 0]; // scratch x,y for single-tile stamps
   private groomedCount = 0;
   private groomableTiles = 0;
   private totalTiles = 0;
@@ -587,15 +588,23 @@ export default class GameScene extends Phaser.Scene {
 
   /** Paint a single tile onto the piste DynamicTexture via its raw Canvas context. */
   private stampPisteTile(texKey: string, tx: number, ty: number, alpha = 1): void {
-    const dt = this.pisteDynTex;
-    const ctx = dt.context!;
+    this.stampPair[0] = tx;
+    this.stampPair[1] = ty;
+    this.stampPisteTiles(texKey, this.stampPair, 1, alpha);
+  }
+
+  /** Paint many tiles with one texture; `tiles` holds interleaved x,y pairs. Frame lookup happens once. */
+  private stampPisteTiles(texKey: string, tiles: ArrayLike<number>, count = tiles.length / 2, alpha = 1): void {
+    const ctx = this.pisteDynTex.context!;
     const frame = this.textures.getFrame(texKey);
     if (!frame) return;
     const src = frame.source.image as HTMLImageElement | HTMLCanvasElement;
     const cd = frame.canvasData as { x: number; y: number; width: number; height: number };
     const ts = this.tileSize;
     ctx.globalAlpha = alpha;
-    ctx.drawImage(src, cd.x, cd.y, cd.width, cd.height, tx * ts, ty * ts, ts, ts);
+    for (let i = 0; i < count; i++) {
+      ctx.drawImage(src, cd.x, cd.y, cd.width, cd.height, tiles[2 * i] * ts, tiles[2 * i + 1] * ts, ts, ts);
+    }
     ctx.globalAlpha = 1;
   }
 
@@ -1,8 +1,10 @@
 """Pytest configuration for Playwright E2E tests."""
 import os
+import io
 import json
 from pathlib import Path
 import pytest
+from PIL import Image
 from playwright.sync_api import Page as PlaywrightPage
 
 _E2E_DURATIONS_FILE = Path(__file__).resolve().parents[2] / '.pytest-e2e-durations.json'
@@ -81,56 +83,71 @@ def pytest_sessionfinish(session, exitstatus):
     )
 
 
+# Resident active-scene tracker, installed as an init script on every page.
+# Rebuilt once per game step (like renderThrottle's poststep monitor); per-scene
+# sys events would miss instances re-added by resetGameScenes.
+SCENE_TRACKER_JS = """(() => {
+    const active = window.__activeScenes = new Set();
+    const hook = () => {
+        const game = window.game;
+        if (!game || !game.events) return requestAnimationFrame(hook);
+        const sync = () => {
+            active.clear();
+            for (const s of game.scene.getScenes(true)) active.add(s.sys.settings.key);
+        };
+        game.events.on('poststep', sync);
+        sync();
+    };
+    hook();
+})();"""
+
+# Reads the tracker's Set; pages without SCENE_TRACKER_JS fall back to
+# walking getScenes(true) so they still wait rather than throw
+_SCENE_IS_JS = """([name, want]) => {
+    const tracked = window.__activeScenes;
+    const active = tracked
+        ? tracked.has(name)
+        : !!window.game?.scene?.getScenes(true).some(s => s.sys.settings.key === name);
+    return active === want;
+}"""
+
+
 def wait_for_scene(page, scene_name: str, timeout: int = 8000):
     """Wait for a specific scene to be active.
-    
+
+    Polls once per frame against window.__activeScenes, which needs the
+    SCENE_TRACKER_JS init script (skip_prologue / new_game_context add it);
+    without it each poll walks the scene list instead. Being a
+    wait_for_function, the wait survives a reload mid-wait.
     Default timeout is 8s to handle CPU contention under parallel test execution.
     """
-    page.wait_for_function(
-        f"""() => {{
-            const game = window.game;
-            if (!game || !game.scene) return false;
-            const scene = game.scene.getScene('{scene_name}');
-            return scene && scene.sys && scene.sys.isActive();
-        }}""",
-        timeout=timeout
-    )
+    page.wait_for_function(_SCENE_IS_JS, arg=[scene_name, True], timeout=timeout, polling='raf')
 
 
 def wait_for_scene_inactive(page, scene_name: str, timeout: int = 8000):
-    """Wait for a specific scene to be inactive."""
-    page.wait_for_function(
-        f"""() => {{
-            const game = window.game;
-            if (!game || !game.scene) return false;
-            const scene = game.scene.getScene('{scene_name}');
-            return !scene || !scene.sys || !scene.sys.isActive();
-        }}""",
-        timeout=timeout
-    )
+    """Wait for a specific scene to be inactive (same tracker requirement as wait_for_scene)."""
+    page.wait_for_function(_SCENE_IS_JS, arg=[scene_name, False], timeout=timeout, polling='raf')
 
 
 def wait_for_game_ready(page, timeout: int = 10000):
     """Wait for the game to be fully initialized with MenuScene active."""
-    page.wait_for_function(
-        """() => {
-            const game = window.game;
-            if (!game || !game.scene) return false;
-            const menu = game.scene.getScene('MenuScene');
-            return menu && menu.sys && menu.sys.isActive();
-        }""",
-        timeout=timeout
-    )
+    wait_for_scene(page, 'MenuScene', timeout=timeout)
+
+
+def open_game(page):
+    """Load the game and wait for MenuScene — the boot step every page fixture shares."""
+    page.goto(GAME_URL)
+    page.wait_for_selector("canvas", timeout=10000)
+    wait_for_game_ready(page)
 
 
 def wait_for_input_ready(page, scene_name: str, timeout: int = 5000):
     """Wait for a scene's input delay to expire (BALANCE.SCENE_INPUT_DELAY)."""
     page.wait_for_function(
-        f"""() => {{
-            const scene = window.game?.scene?.getScene('{scene_name}');
-            return scene?.inputReady === true;
-        }}""",
-        timeout=timeout
+        """(name) => window.game?.scene?.getScene(name)?.inputReady === true""",
+        arg=scene_name,
+        timeout=timeout,
+        polling='raf',
     )
 
 
@@ -144,27 +161,29 @@ def wait_for_level_or_credits(page, expected_level: int, timeout: int = 10000):
     Returns 'level' if level loaded, 'credits' if credits shown.
     """
     result = page.wait_for_function(
-        f"""() => {{
+        """(expectedLevel) => {
             const game = window.game;
             if (!game || !game.scene) return null;
             
             // Check if credits scene is active
             const credits = game.scene.getScene('CreditsScene');
-            if (credits && credits.sys && credits.sys.isActive()) {{
+            if (credits && credits.sys && credits.sys.isActive()) {
                 return 'credits';
-            }}
+            }
             
             // Check if game scene has reached expected level
             const gameScene = game.scene.getScene('GameScene');
-            if (gameScene && gameScene.sys && gameScene.sys.isActive()) {{
-                if (typeof gameScene.levelIndex === 'number' && gameScene.levelIndex >= {expected_level}) {{
+            if (gameScene && gameScene.sys && gameScene.sys.isActive()) {
+                if (typeof gameScene.levelIndex === 'number' && gameScene.levelIndex >= expectedLevel) {
                     return 'level';
-                }}
-            }}
+                }
+            }
             
             return null;
-        }}""",
-        timeout=timeout
+        }""",
+        arg=expected_level,
+        timeout=timeout,
+        polling='raf',
     )
     return result.json_value() if result else None
 
@@ -172,18 +191,34 @@ def wait_for_level_or_credits(page, expected_level: int, timeout: int = 10000):
 def skip_to_credits(page, timeout_per_level: int = 10000):
     """Skip through all levels to reach CreditsScene.
     
-    Deterministic approach that waits for each level transition to complete.
+    Runs the HUD's skip-level path (what pressing N does) for each level in
+    one in-page loop, waiting a frame at a time for the next HUD to come up.
     Uses longer timeout to handle asset loading between levels.
     """
-    for i in range(11):
-        page.keyboard.press("n")
-        page.wait_for_timeout(100)
-        result = wait_for_level_or_credits(page, i + 1, timeout=timeout_per_level)
-        if result == 'credits':
-            return  # Done - credits are showing
-    
-    # If we got here without credits, wait for them
-    wait_for_scene(page, 'CreditsScene', timeout=timeout_per_level)
+    page.evaluate("""async (timeout) => {
+        const game = window.game;
+        const until = (pred) => new Promise((resolve, reject) => {
+            const deadline = performance.now() + timeout;
+            const tick = () => {
+                const v = pred();
+                if (v) resolve(v);
+                else if (performance.now() > deadline) reject(new Error('skip_to_credits: level transition timed out'));
+                else requestAnimationFrame(tick);
+            };
+            tick();
+        });
+        let levelId = -1;
+        for (;;) {
+            const next = await until(() => {
+                if (game.scene.isActive('CreditsScene')) return 'credits';
+                const hud = game.scene.getScene('HUDScene');
+                return hud && hud.sys.isActive() && hud.level && hud.level.id > levelId ? hud : null;
+            });
+            if (next === 'credits') return;
+            levelId = next.level.id;
+            next.skipLevel();
+        }
+    }""", timeout_per_level)
 
 
 # Level nameKey → array index mapping (must match src/config/levels.ts order)
@@ -217,74 +252,102 @@ def skip_to_level(page, level, timeout: int = 10000):
         level_index = level
     
     # Use the game's transitionToLevel method directly
-    page.evaluate(f"""() => {{
+    page.evaluate("""(levelIndex) => {
         const gameScene = window.game?.scene?.getScene('GameScene');
-        if (gameScene && gameScene.transitionToLevel) {{
-            gameScene.transitionToLevel({level_index});
-        }}
-    }}""")
+        if (gameScene && gameScene.transitionToLevel) {
+            gameScene.transitionToLevel(levelIndex);
+        }
+    }""", level_index)
     
     # Wait for the level to be loaded
     page.wait_for_function(
-        f"""() => {{
+        """(levelIndex) => {
             const gameScene = window.game?.scene?.getScene('GameScene');
             return gameScene && 
                    gameScene.sys && 
                    gameScene.sys.isActive() && 
-                   gameScene.levelIndex === {level_index};
-        }}""",
-        timeout=timeout
+                   gameScene.levelIndex === levelIndex;
+        }""",
+        arg=level_index,
+        timeout=timeout,
+        polling='raf',
     )
 
 
 def dismiss_dialogues(page, timeout: int = 5000):
     """Dismiss any active dialogues programmatically.
     
-    Directly calls hideDialogue() on DialogueScene if showing.
+    Directly calls hideDialogue() on DialogueScene if showing, then waits
+    (in the same evaluate) for isDialogueShowing() to clear.
     More reliable than clicking.
     """
-    page.evaluate("""() => {
+    page.evaluate("""async (timeout) => {
         const ds = window.game?.scene?.getScene('DialogueScene');
-        if (ds && ds.isDialogueShowing && ds.isDialogueShowing()) {
-            // Clear dialogue queue and hide
-            if (ds.dialogueQueue) ds.dialogueQueue = [];
-            if (ds.hideDialogue) ds.hideDialogue();
+        if (!ds || !ds.isDialogueShowing || !ds.isDialogueShowing()) return;
+        // Clear dialogue queue and hide
+        if (ds.dialogueQueue) ds.dialogueQueue = [];
+        if (ds.hideDialogue) ds.hideDialogue();
+        const deadline = performance.now() + timeout;
+        await new Promise((resolve, reject) => {
+            const check = () => {
+                if (!ds.isDialogueShowing()) resolve();
+                else if (performance.now() > deadline) reject(new Error(`Timeout ${timeout}ms waiting for dialogue to hide`));
+                else requestAnimationFrame(check);
+            };
+            check();
+        });
+    }""", timeout)
+
+
+def click_menu_button(page, button_index: int, button_name: str = "button", timeout: int = 5000,
+                      scene_name: str = 'MenuScene'):
+    """Click a scene menu button by index. Prefer click_menu_by_key() for resilience to reordering.
+
+    Fires the button's click handler directly (pointerup on MenuScene,
+    pointerdown on PauseScene), waiting a frame at a time if the scene
+    hasn't built its buttons yet. Fails at once if the scene isn't active:
+    a stopped scene keeps its menuButtons array, but the buttons in it are
+    destroyed and emitting on them does nothing.
+    """
+    page.evaluate("""async ([sceneName, idx, name, timeout]) => {
+        const deadline = performance.now() + timeout;
+        for (;;) {
+            const scene = window.game?.scene?.getScene(sceneName);
+            if (scene && !scene.sys.isActive()) throw new Error(`Cannot click ${name}: ${sceneName} is not active`);
+            const btn = scene?.menuButtons?.[idx];
+            if (btn) return btn.emit(btn.listenerCount('pointerup') ? 'pointerup' : 'pointerdown');
+            if (performance.now() > deadline) throw new Error(`${sceneName} ${name} (index ${idx}) not found after ${timeout}ms`);
+            await new Promise(requestAnimationFrame);
         }
-    }""")
-    # Wait for dialogue to be hidden
-    page.wait_for_function("""() => {
-        const ds = window.game?.scene?.getScene('DialogueScene');
-        return !ds || !ds.isDialogueShowing || !ds.isDialogueShowing();
-    }""", timeout=timeout)
-
-
-def click_menu_button(page, button_index: int, button_name: str = "button"):
-    """Click a menu button by index. Prefer click_menu_by_key() for resilience to reordering."""
-    for _ in range(button_index):
-        page.keyboard.press("ArrowDown")
-        page.wait_for_timeout(50)
-    page.keyboard.press("Enter")
+    }""", [scene_name, button_index, button_name, timeout])
 
 
 def find_menu_button_index(page, key: str, scene_name: str = 'MenuScene') -> int:
     """Find a menu button's index by its data key (e.g., 'startGame', 'settings').
     Works with any scene that has a menuButtons array with data keys."""
-    idx = page.evaluate(f"""() => {{
-        const scene = window.game?.scene?.getScene('{scene_name}');
+    idx = page.evaluate("""([sceneName, key]) => {
+        const scene = window.game?.scene?.getScene(sceneName);
         if (!scene?.menuButtons) return -1;
-        return scene.menuButtons.findIndex(b => b.getData('key') === '{key}');
-    }}""")
+        return scene.menuButtons.findIndex(b => b.getData('key') === key);
+    }""", [scene_name, key])
     assert idx >= 0, f"Button with key '{key}' not found in {scene_name}"
     return idx
 
 
 def click_menu_by_key(page, key: str, scene_name: str = 'MenuScene'):
-    """Click a scene menu button by its data key — immune to button reordering."""
-    idx = find_menu_button_index(page, key, scene_name)
-    page.evaluate(f"""() => {{
-        const scene = window.game?.scene?.getScene('{scene_name}');
-        if (scene?.buttonNav?.select) scene.buttonNav.select({idx});
-    }}""")
+    """Click a scene menu button by its data key — immune to button reordering.
+
+    The index is looked up and selected in the same evaluate; it is not
+    cached across calls because the menu's button list depends on progress.
+    """
+    idx = page.evaluate("""([sceneName, key]) => {
+        const scene = window.game?.scene?.getScene(sceneName);
+        if (!scene?.menuButtons) return -1;
+        const idx = scene.menuButtons.findIndex(b => b.getData('key') === key);
+        if (idx >= 0 && scene.buttonNav?.select) scene.buttonNav.select(idx);
+        return idx;
+    }""", [scene_name, key])
+    assert idx >= 0, f"Button with key '{key}' not found in {scene_name}"
     page.keyboard.press("Enter")
     page.wait_for_timeout(50)
 
@@ -293,10 +356,24 @@ def click_menu_by_key(page, key: str, scene_name: str = 'MenuScene'):
 BUTTON_START = 0
 
 
-def click_button(page, button_index: int, description: str):
-    """Click a menu button by index and wait briefly for it to register."""
-    click_menu_button(page, button_index, description)
-    page.wait_for_timeout(100)
+# The handler runs synchronously inside the evaluate, so there is nothing left
+# to sleep for; callers wait_for_scene() on the transition they expect.
+click_button = click_menu_button
+
+
+def canvas_box(page) -> dict:
+    """Canvas bounding box, cached on the page per viewport size.
+
+    The canvas fills the viewport and never moves, so clicks within a test
+    can share one bounding_box() round trip.
+    """
+    cached = getattr(page, '_canvas_box', None)
+    viewport = page.viewport_size
+    if cached is None or cached[0] != viewport:
+        box = page.locator("canvas").bounding_box()
+        assert box, "Canvas not found"
+        cached = page._canvas_box = (viewport, box)
+    return cached[1]
 
 
 def navigate_to_daily_runs(page):
@@ -305,89 +382,100 @@ def navigate_to_daily_runs(page):
     wait_for_scene(page, "DailyRunsScene")
 
 
+_UNLOCK_ALL_JS = """() => {
+    const stats = {};
+    for (let i = 0; i <= 10; i++) {
+        stats[i] = {completed: true, bestStars: 3, bestTime: 60, bestBonusMet: 0};
+    }
+    localStorage.setItem('snowGroomer_progress', JSON.stringify({
+        currentLevel: 11,
+        levelStats: stats,
+        savedAt: new Date().toISOString()
+    }));
+}"""
+
+
 def unlock_all_levels(page):
     """Set localStorage so all 11 campaign levels are completed."""
-    page.evaluate("""() => {
-        const stats = {};
-        for (let i = 0; i <= 10; i++) {
-            stats[i] = {completed: true, bestStars: 3, bestTime: 60, bestBonusMet: 0};
-        }
-        localStorage.setItem('snowGroomer_progress', JSON.stringify({
-            currentLevel: 11,
-            levelStats: stats,
-            savedAt: new Date().toISOString()
-        }));
+    page.evaluate(_UNLOCK_ALL_JS)
+
+
+def seed_unlocked_progress(page):
+    """Unlock all levels before the page's next load, without a boot + reload.
+
+    Installed as a page init script; it only writes when no progress is
+    saved, so progress the game stores later in the test is kept.
+    """
+    page.add_init_script(
+        "if (!localStorage.getItem('snowGroomer_progress')) (" + _UNLOCK_ALL_JS + ")();")
+
+
+def _snapshot(page) -> dict:
+    """Error text, active scene keys and GameScene level in one evaluate."""
+    return page.evaluate("""() => {
+        const errorDiv = document.getElementById('game-container')?.querySelector('.error-message');
+        const scene = window.game?.scene;
+        const gameScene = scene?.getScene('GameScene');
+        return {
+            error: errorDiv ? errorDiv.textContent : null,
+            scenes: scene ? scene.getScenes(true).map(s => s.scene.key) : [],
+            level: gameScene?.levelIndex ?? -1,
+        };
     }""")
 
 
 def get_active_scenes(page) -> list:
     """Get list of active Phaser scene keys."""
-    return page.evaluate("""() => {
-        if (window.game && window.game.scene) {
-            return window.game.scene.getScenes(true).map(s => s.scene.key);
-        }
-        return [];
-    }""")
+    return _snapshot(page)['scenes']
 
 
 def get_current_level(page) -> int:
     """Get current level index from GameScene."""
-    return page.evaluate("""() => {
-        if (window.game && window.game.scene) {
-            const gameScene = window.game.scene.getScene('GameScene');
-            if (gameScene && gameScene.levelIndex !== undefined) {
-                return gameScene.levelIndex;
-            }
-        }
-        return -1;
-    }""")
+    return _snapshot(page)['level']
+
+
+def _assert_healthy(page) -> list:
+    """Shared by the assert_* helpers: check for errors and return active scenes."""
+    snap = _snapshot(page)
+    assert snap['error'] is None, f"Error message displayed: {snap['error']}"
+    assert len(snap['scenes']) > 0, "No active scenes - game may have crashed"
+    return snap['scenes']
 
 
 def assert_no_error_message(page):
     """Assert there's no error message displayed on screen."""
-    error_visible = page.evaluate("""() => {
-        const container = document.getElementById('game-container');
-        if (container) {
-            const errorDiv = container.querySelector('.error-message');
-            if (errorDiv) return errorDiv.textContent;
-        }
-        return null;
-    }""")
-    assert error_visible is None, f"Error message displayed: {error_visible}"
-    scenes = get_active_scenes(page)
-    assert len(scenes) > 0, "No active scenes - game may have crashed"
+    _assert_healthy(page)
 
 
 def assert_canvas_renders_content(page):
-    """Assert canvas has non-black content (catches Firefox rendering issues)."""
-    from PIL import Image
-    import io
-
-    screenshot = page.screenshot()
-    img = Image.open(io.BytesIO(screenshot))
-    pixels = img.load()
-    w, h = img.size
-
-    samples = [
-        pixels[w//2, h//2],
-        pixels[w//2, h//4],
-        pixels[w//4, h//2],
-        pixels[3*w//4, h//2],
-        pixels[w//2, 3*h//4],
-    ]
+    """Assert canvas has non-black content (catches Firefox rendering issues).
+
+    Samples five composited pixels, so CSS canvas filters (high contrast,
+    colorblind) and browser compositing bugs are seen. One screenshot
+    clipped to the central (w/4, h/4)-(3w/4, 3h/4) box covers all five
+    points, a quarter of the viewport to encode and decode.
+    """
+    size = page.viewport_size
+    w, h = size["width"], size["height"]
+    x0, y0 = w // 4, h // 4
+    clip = {"x": x0, "y": y0, "width": 3 * w // 4 - x0 + 1, "height": 3 * h // 4 - y0 + 1}
+    img = Image.open(io.BytesIO(page.screenshot(clip=clip, scale="css"))).convert("RGB")
+    samples = [img.getpixel((x - x0, y - y0)) for x, y in [
+        (w // 2, h // 2), (w // 2, h // 4), (w // 4, h // 2),
+        (3 * w // 4, h // 2), (w // 2, 3 * h // 4),
+    ]]
 
     has_content = any(
         (p[0] > 20 or p[1] > 20 or p[2] > 20) for p in samples
     )
 
     assert has_content, \
-        f"Screen appears all black - possible rendering issue. Samples (RGBA): {samples}"
+        f"Screen appears all black - possible rendering issue. Samples (RGB): {samples}"
 
 
 def assert_scene_active(page, scene_key: str, msg: str = ""):
     """Assert that a specific scene is active."""
-    assert_no_error_message(page)
-    scenes = get_active_scenes(page)
+    scenes = _assert_healthy(page)
     assert scene_key in scenes, f"Expected '{scene_key}' to be active. Active scenes: {scenes}. {msg}"
 
 
@@ -399,8 +487,7 @@ def assert_scene_not_active(page, scene_key: str, msg: str = ""):
 
 def assert_not_on_menu(page):
     """Assert we're no longer on the menu."""
-    assert_no_error_message(page)
-    scenes = get_active_scenes(page)
+    scenes = _assert_healthy(page)
     assert 'MenuScene' not in scenes, f"Still on MenuScene! Button click likely missed. Active: {scenes}"
 
 
@@ -440,10 +527,39 @@ def browser_context_args(browser_context_args):
     }
 
 
+# Static files the game never draws: favicon, PWA icons, web fonts, media.
+# Phaser textures are generated at runtime, so nothing on the canvas is
+# fetched as an image. A glob keeps every other request off the route path.
+_UNUSED_ASSETS_GLOB = "**/*.{png,ico,svg,woff,woff2,ttf,mp3,ogg,wav}"
+
+
+def new_game_context(browser, viewport: dict):
+    """Create a context whose pages skip the prologue and track active scenes."""
+    context = browser.new_context(viewport=viewport)
+    context.route(_UNUSED_ASSETS_GLOB, lambda route: route.abort())
+    context.add_init_script("localStorage.setItem('snowGroomer_prologueSeen', '1');")
+    context.add_init_script(SCENE_TRACKER_JS)
+    return context
+
+
+@pytest.fixture(scope="session")
+def a11y_context(browser):
+    """Shared 1280x720 context for the accessibility suite, one per xdist worker.
+
+    Session scope rather than module scope: duration ordering interleaves
+    modules on a worker, which would tear a module fixture down and
+    rebuild it each time the worker came back to the module.
+    """
+    context = new_game_context(browser, {"width": 1280, "height": 720})
+    yield context
+    context.close()
+
+
 @pytest.fixture(autouse=True)
 def skip_prologue(page):
-    """Skip the cold-open prologue in all tests."""
+    """Skip the cold-open prologue and install the scene tracker in all tests."""
     page.add_init_script("localStorage.setItem('snowGroomer_prologueSeen', '1');")
+    page.add_init_script(SCENE_TRACKER_JS)
 
 
 @pytest.fixture(scope='session', autouse=True)
@@ -469,12 +585,10 @@ def disable_nonessential_screenshot_writes():
 
 @pytest.fixture
 def game_page(page):
-    """Navigate to the game and wait for Phaser to initialize."""
-    page.goto(GAME_URL)
-    # Wait for Phaser game canvas to be ready
-    page.wait_for_selector("canvas", timeout=10000)
-    # Wait for MenuScene to be active (more reliable than timeout)
-    wait_for_game_ready(page)
-    yield page
-    # Teardown: clear localStorage to prevent state leakage between tests
-    page.evaluate("localStorage.clear()")
+    """Navigate to the game and wait for Phaser to initialize.
+
+    ``page`` comes from a fresh per-test context, so localStorage starts empty
+    and is discarded with it; no teardown clear is needed.
+    """
+    open_game(page)
+    return page
@@ -6,23 +6,29 @@ park features (kickers, rails, halfpipe walls), and slalom gates
 as color-coded tile maps.
 
 Usage:
-    python tests/e2e/generate_level_previews.py [--out DIR] [--ranks RANKS] [--count N]
+    python tests/e2e/generate_level_previews.py [--out DIR] [--ranks RANKS] [--count N] [--workers N] [--force]
 
 Options:
     --out DIR      Output directory (default: tests/screenshots/level-variety)
     --ranks RANKS  Comma-separated ranks to generate (default: green,blue,red,black)
     --count N      Max seeds to scan per target (default: 500)
+    --samples N    Samples per target shape/combo (default: 5)
+    --workers N    Browsers to split the targets across (default: 4)
+    --force        Re-render previews whose PNG already exists in the output directory
 """
 import argparse
+import base64
 import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Add project root so conftest helpers can be imported
 sys.path.insert(0, os.path.dirname(__file__))
 
 from playwright.sync_api import sync_playwright
-from conftest import GAME_URL, wait_for_scene
+from conftest import GAME_URL
+
+MAX_WORKERS = 4
 
 # ---------------------------------------------------------------------------
 # Browser-side JavaScript snippets
@@ -93,118 +99,144 @@ GENERATE_LEVELS_JS = """(args) => {
         return gates;
     }
 
-    const results = [];
-    for (const t of targets) {
-        let found = 0;
-        for (let seed = 1; seed <= maxSeed && found < samplesPerTarget; seed++) {
-            const { level } = generateValidDailyRunLevel(seed, t.rank);
-            const isPark = level.difficulty === 'park';
+    function matches(t, level, isPark, fkey) {
+        if (t.filterType === 'park') return isPark && (!t.featureFilter || fkey === t.featureFilter);
+        if (t.filterType === 'regular') return !isPark;
+        return !isPark && level.pisteShape === t.filterType;
+    }
 
-            if (t.filterType === 'park') {
-                if (!isPark) continue;
-                if (t.featureFilter) {
-                    const fkey = (level.specialFeatures || []).sort().join('+');
-                    if (fkey !== t.featureFilter) continue;
-                }
-            } else if (t.filterType === 'regular') {
-                if (isPark) continue;
-            } else {
-                if (isPark || level.pisteShape !== t.filterType) continue;
-            }
+    // Bulky per-sample drawing data stays in the page for BATCH_RENDER_JS;
+    // only the summary fields travel back to Python
+    const store = window.__previewData = [];
 
-            const geo = new LevelGeometry();
-            geo.generate(level, ts);
-
-            // Tile map
-            const pixels = [];
-            for (let y = 0; y < level.height; y++) {
-                for (let x = 0; x < level.width; x++) {
-                    const inP = geo.isInPiste(x, y, level);
-                    let isSteep = false;
-                    if (level.steepZones) {
-                        for (const sz of level.steepZones) {
-                            const sy = Math.floor(sz.startY * level.height);
-                            const ey = Math.floor(sz.endY * level.height);
-                            if (y >= sy && y < ey && inP) isSteep = true;
-                        }
-                    }
-                    pixels.push({ x, y, t: isSteep ? 'S' : inP ? 'P' : '.' });
-                }
+    function buildSample(level, seed, rank, isPark, features) {
+        const geo = new LevelGeometry();
+        geo.generate(level, ts);
+
+        // Rows covered by any steep zone
+        const steepRow = new Uint8Array(level.height);
+        for (const sz of level.steepZones || []) {
+            const sy = Math.floor(sz.startY * level.height);
+            const ey = Math.floor(sz.endY * level.height);
+            for (let r = Math.max(0, sy); r < ey && r < level.height; r++) steepRow[r] = 1;
+        }
+
+        // Tile map: one byte per tile (0 = off-piste, 1 = piste, 2 = steep).
+        // Each row's piste span is [ceil(cx - hw), ceil(cx + hw)), the
+        // integer form of LevelGeometry.isInPiste, filled in one call
+        const tiles = new Uint8Array(level.width * level.height);
+        for (let y = 3; y < level.height - 2; y++) {
+            const p = geo.pistePath[y];
+            let x0 = 0, x1 = level.width;
+            if (p) {
+                const hw = p.width / 2;
+                x0 = Math.max(0, Math.ceil(p.centerX - hw));
+                x1 = Math.min(level.width, Math.ceil(p.centerX + hw));
             }
+            if (x1 > x0) tiles.fill(steepRow[y] ? 2 : 1, y * level.width + x0, y * level.width + x1);
+        }
 
-            // Service road curves
-            const roadCurves = (geo.accessPathCurves || []).map(curve => ({
-                left: curve.leftEdge.map(p => ({ x: p.x / ts, y: p.y / ts })),
-                right: curve.rightEdge.map(p => ({ x: p.x / ts, y: p.y / ts })),
-            }));
-
-            // Park features
-            const parkFeatures = [];
-            const specials = level.specialFeatures || [];
-            const inHP = specials.includes('halfpipe');
-            if (inHP) {
-                const PW = 3;
-                for (let y = 3; y < level.height - 3; y++) {
-                    const p = geo.pistePath[y];
-                    if (!p) continue;
-                    const halfW = p.width / 2;
-                    for (let dx = 0; dx < PW; dx++) {
-                        parkFeatures.push({ x: Math.floor(p.centerX - halfW + dx), y, t: 'W' });
-                        parkFeatures.push({ x: Math.floor(p.centerX + halfW - PW + dx), y, t: 'W' });
-                    }
+        // Service road curves
+        const roadCurves = (geo.accessPathCurves || []).map(curve => ({
+            left: curve.leftEdge.map(p => ({ x: p.x / ts, y: p.y / ts })),
+            right: curve.rightEdge.map(p => ({ x: p.x / ts, y: p.y / ts })),
+        }));
+
+        // Park features: overlay layer, one byte per tile
+        // (0 = none, 1 = pipe wall, 2 = kicker, 3 = rail); later features win
+        const lw = level.width, lh = level.height;
+        const park = new Uint8Array(lw * lh);
+        let parkCount = 0;
+        const markPark = (x, y, code) => {
+            if (x < 0 || x >= lw || y < 0 || y >= lh) return;
+            park[y * lw + x] = code;
+            parkCount++;
+        };
+        const specials = level.specialFeatures || [];
+        const inHP = specials.includes('halfpipe');
+        if (inHP) {
+            const PW = 3;
+            for (let y = 3; y < lh - 3; y++) {
+                const p = geo.pistePath[y];
+                if (!p) continue;
+                const halfW = p.width / 2;
+                const leftX = Math.floor(p.centerX - halfW);
+                const rightX = Math.floor(p.centerX + halfW - PW);
+                for (let dx = 0; dx < PW; dx++) {
+                    markPark(leftX + dx, y, 1);
+                    markPark(rightX + dx, y, 1);
                 }
             }
-            // Compute pipe floor half-width for feature offset
-            const midY = Math.floor(level.height / 2);
-            const midPath = geo.pistePath[midY];
-            const pipeFloorHW = midPath ? Math.floor(midPath.width / 2) - 3 : 0;
-            const hasBoth = inHP && specials.includes('kickers') && specials.includes('rails');
-            const offsetHW = hasBoth ? pipeFloorHW : 0;
-            for (const fType of ['kickers', 'rails']) {
-                if (!specials.includes(fType)) continue;
-                const baseType = fType === 'kickers' ? 'kicker' : 'rail';
-                for (const f of genFeatures(baseType, level.height, level.id || 0, inHP, offsetHW)) {
-                    const p = geo.pistePath[f.tileY];
-                    if (!p) continue;
-                    const cx = Math.floor(p.centerX + f.tileX);
-                    const fw = f.type === 'kicker' ? 3 : 1;
-                    const fh = f.type === 'kicker' ? 2 : 3;
-                    const ch = f.type === 'kicker' ? 'K' : 'J';
-                    for (let dy = 0; dy < fh; dy++)
-                        for (let dx = -Math.floor(fw/2); dx <= Math.floor(fw/2); dx++)
-                            parkFeatures.push({ x: cx + dx, y: f.tileY + dy, t: ch });
-                }
+        }
+        // Compute pipe floor half-width for feature offset
+        const midY = Math.floor(level.height / 2);
+        const midPath = geo.pistePath[midY];
+        const pipeFloorHW = midPath ? Math.floor(midPath.width / 2) - 3 : 0;
+        const hasBoth = inHP && specials.includes('kickers') && specials.includes('rails');
+        const offsetHW = hasBoth ? pipeFloorHW : 0;
+        for (const fType of ['kickers', 'rails']) {
+            if (!specials.includes(fType)) continue;
+            const baseType = fType === 'kickers' ? 'kicker' : 'rail';
+            for (const f of genFeatures(baseType, level.height, level.id || 0, inHP, offsetHW)) {
+                const p = geo.pistePath[f.tileY];
+                if (!p) continue;
+                const cx = Math.floor(p.centerX + f.tileX);
+                const half = f.w >> 1;
+                const code = f.type === 'kicker' ? 2 : 3;
+                for (let y = f.tileY, yEnd = f.tileY + f.h; y < yEnd; y++)
+                    for (let x = cx - half, xEnd = cx + half; x <= xEnd; x++)
+                        markPark(x, y, code);
             }
+        }
+
+        const slalomGates = genSlalom(level, geo);
+        const steepInfo = (level.steepZones || []).map(s => s.slope + '°').join(',');
+        const slalomInfo = level.slalomGates
+            ? level.slalomGates.count + 'g w' + level.slalomGates.width : '';
+
+        store.push({ tiles, park: parkCount ? park : null, roadCurves, slalomGates });
+        return {
+            id: store.length - 1, rank, seed, shape: level.pisteShape, isPark, features,
+            w: level.width, h: level.height,
+            pw: (level.pisteWidth * 100).toFixed(0),
+            time: level.timeLimit, coverage: level.targetCoverage,
+            steepInfo, slalomInfo,
+            anchors: (level.winchAnchors || []).map(a => a.y),
+            steepBounds: (level.steepZones || []).map(sz => [sz.startY, sz.endY, sz.slope]),
+        };
+    }
 
-            const slalomGates = genSlalom(level, geo);
-            const features = specials.join('+') || '';
-            const steepInfo = (level.steepZones || []).map(s => s.slope + '°').join(',');
-            const slalomInfo = level.slalomGates
-                ? level.slalomGates.count + 'g w' + level.slalomGates.width : '';
-
-            results.push({
-                rank: t.rank, seed, shape: level.pisteShape, isPark, features,
-                w: level.width, h: level.height,
-                pw: (level.pisteWidth * 100).toFixed(0),
-                time: level.timeLimit, coverage: level.targetCoverage,
-                steepInfo, slalomInfo,
-                anchors: (level.winchAnchors || []).map(a => a.y),
-                steepBounds: (level.steepZones || []).map(sz => [sz.startY, sz.endY, sz.slope]),
-                pixels, roadCurves, parkFeatures, slalomGates,
-            });
-            found++;
+    // Generate each (rank, seed) level once and hand it to every target of
+    // that rank that matches and still needs samples
+    const byRank = new Map();
+    for (const t of targets) {
+        if (!byRank.has(t.rank)) byRank.set(t.rank, []);
+        byRank.get(t.rank).push({ t, found: 0 });
+    }
+    const results = [];
+    for (const [rank, wanted] of byRank) {
+        for (let seed = 1; seed <= maxSeed; seed++) {
+            const open = wanted.filter(e => e.found < samplesPerTarget);
+            if (open.length === 0) break;
+            const { level } = generateValidDailyRunLevel(seed, rank);
+            const isPark = level.difficulty === 'park';
+            const fkey = (level.specialFeatures || []).slice().sort().join('+');
+            const hits = open.filter(e => matches(e.t, level, isPark, fkey));
+            if (hits.length === 0) continue;
+            // Overlapping targets share the sample (same file name), so it
+            // is built and rendered once
+            results.push(buildSample(level, seed, rank, isPark, fkey));
+            for (const e of hits) e.found++;
         }
     }
     return results;
 }"""
 
+# Draws one preview onto a detached canvas and returns it
 RENDER_JS = """(args) => {
-    const { pixels, roadCurves, parkFeatures, slalomGates,
+    const { tiles, park, roadCurves, slalomGates,
             w, h, label1, label2, anchors, steepBounds, isPark } = args;
-    let c = document.getElementById('__auditCanvas');
-    if (c) c.remove();
-    c = document.createElement('canvas');
-    c.id = '__auditCanvas';
+    const c = document.createElement('canvas');
     const scale = 4;
     const marginR = 50;
     const headerH = 42;
@@ -213,12 +245,6 @@ RENDER_JS = """(args) => {
     const ch = h * scale + headerH + legendH;
     c.width = cw;
     c.height = ch;
-    c.style.position = 'fixed';
-    c.style.top = '0';
-    c.style.left = '0';
-    c.style.zIndex = '99999';
-    c.style.imageRendering = 'pixelated';
-    document.body.appendChild(c);
     const ctx = c.getContext('2d');
 
     ctx.fillStyle = '#f5f0eb';
@@ -230,12 +256,46 @@ RENDER_JS = """(args) => {
     ctx.fillStyle = '#666';
     ctx.fillText(label2, 4, 32);
 
-    const COLORS = { '.': '#c4d4c0', 'P': '#e8e0d8', 'S': '#ef4444' };
-    for (const p of pixels) {
-        ctx.fillStyle = COLORS[p.t];
-        ctx.fillRect(p.x * scale, p.y * scale + headerH, scale, scale);
+    // Paint a tile-code layer: one pixel per tile through an RGBA palette,
+    // then a single nearest-neighbour upscale onto the preview. Layers are
+    // cached by content so samples with identical geometry reuse the same
+    // small canvas. The FNV-1a hash + size + palette key only picks a
+    // bucket; a hit also needs the exact codes, so a hash collision can
+    // never paint another map's geometry
+    const cache = window.__layerCache || (window.__layerCache = new Map());
+    function sameCodes(a, b) {
+        if (a.length !== b.length) return false;
+        for (let i = 0; i < a.length; i++) if (a[i] !== b[i]) return false;
+        return true;
+    }
+    function paintLayer(codes, rgba) {
+        let hash = 0x811c9dc5;
+        for (let i = 0; i < codes.length; i++) hash = Math.imul(hash ^ codes[i], 0x01000193);
+        const key = (hash >>> 0) + '_' + w + 'x' + h + '_' + rgba.join(',');
+        let bucket = cache.get(key);
+        if (!bucket) cache.set(key, bucket = []);
+        let layer = bucket.find(e => sameCodes(e.codes, codes))?.canvas;
+        if (!layer) {
+            const pal = new Uint32Array(new Uint8Array(rgba).buffer);
+            layer = document.createElement('canvas');
+            layer.width = w;
+            layer.height = h;
+            const layerCtx = layer.getContext('2d');
+            const img = layerCtx.createImageData(w, h);
+            const d32 = new Uint32Array(img.data.buffer);
+            for (let i = 0; i < codes.length; i++) d32[i] = pal[codes[i]];
+            layerCtx.putImageData(img, 0, 0);
+            bucket.push({ codes, canvas: layer });
+        }
+        ctx.imageSmoothingEnabled = false;
+        ctx.drawImage(layer, 0, headerH, w * scale, h * scale);
     }
 
+    // Tile map: off-piste #c4d4c0, piste #e8e0d8, steep #ef4444
+    paintLayer(tiles, [
+        0xc4, 0xd4, 0xc0, 255,  0xe8, 0xe0, 0xd8, 255,  0xef, 0x44, 0x44, 255,
+    ]);
+
     // Service road curves (filled polygon from left/right edge arrays)
     for (const curve of roadCurves) {
         ctx.fillStyle = '#d4a574';
@@ -250,14 +310,11 @@ RENDER_JS = """(args) => {
         ctx.fill();
     }
 
-    // Park features overlay
-    const FEAT = { 'W': '#8b7355', 'K': '#4488cc', 'J': '#cc8844' };
-    for (const f of parkFeatures) {
-        if (f.x >= 0 && f.x < w && f.y >= 0 && f.y < h) {
-            ctx.fillStyle = FEAT[f.t];
-            ctx.fillRect(f.x * scale, f.y * scale + headerH, scale, scale);
-        }
-    }
+    // Park features overlay: none (transparent), pipe wall #8b7355,
+    // kicker #4488cc, rail #cc8844
+    if (park) paintLayer(park, [
+        0, 0, 0, 0,  0x8b, 0x73, 0x55, 255,  0x44, 0x88, 0xcc, 255,  0xcc, 0x88, 0x44, 255,
+    ]);
 
     // Slalom gates (poles + dashed corridor)
     for (const g of slalomGates) {
@@ -319,38 +376,125 @@ RENDER_JS = """(args) => {
         ctx.fillText(name, lx + 10, ly + 8);
         lx += ctx.measureText(name).width + 18;
     }
+    return c;
+}"""
+
+# Renders every preview in one round trip; returns [{fname, dataUrl}]
+BATCH_RENDER_JS = """(jobs) => {
+    const render = """ + RENDER_JS + """;
+    return jobs.map(job => ({
+        fname: job.fname,
+        dataUrl: render({ ...window.__previewData[job.id], ...job }).toDataURL('image/png'),
+    }));
 }"""
 
 # ---------------------------------------------------------------------------
 # Target definitions: what levels to sample
 # ---------------------------------------------------------------------------
 
+# (filterType, featureFilter) per rank, in generation order. Parks get one
+# target per feature combo plus an any-combo one
+TARGET_FILTERS = {
+    'green': [('park', feat) for feat in ['halfpipe+kickers', 'kickers+rails', 'kickers',
+                                          'halfpipe+kickers+rails']]
+             + [('park', None), ('regular', None)],
+    'blue': [(shape, None) for shape in ['gentle_curve', 'winding', 'dogleg']],
+    'red': [(shape, None) for shape in ['serpentine', 'hourglass', 'winding']],
+    'black': [(shape, None) for shape in ['serpentine', 'dogleg', 'hourglass', 'winding']],
+}
+
+# File name and header templates, keyed by isPark
+FNAME_TEMPLATES = {
+    True: '{rank}_park_{fkey}_s{seed}',
+    False: '{rank}_{shape}_s{seed}',
+}
+LABEL1_TEMPLATES = {
+    True: '{RANK} PARK ({features}) — {shape} {w}x{h}',
+    False: '{RANK} — {shape} {w}x{h}',
+}
+
+
 def build_targets(ranks: list[str]) -> list[dict]:
     """Build the list of level targets to find (one per shape/feature combo)."""
-    targets = []
+    return [{'rank': rank, 'filterType': filter_type, 'featureFilter': feature_filter}
+            for rank, filters in TARGET_FILTERS.items() if rank in ranks
+            for filter_type, feature_filter in filters]
+
+
+def render_job(sample: dict) -> dict:
+    """Turn a generated level summary into a BATCH_RENDER_JS job (filename + labels)."""
+    is_park = sample['isPark']
+    fields = {**sample, 'RANK': sample['rank'].upper(),
+              'fkey': sample['features'].replace('+', '_')}
+
+    label2 = f"pw={sample['pw']}% cov={sample['coverage']}% t={sample['time']}s"
+    if sample['steepInfo']:
+        label2 += f" | steep=[{sample['steepInfo']}]"
+    if sample['slalomInfo']:
+        label2 += f" | slalom={sample['slalomInfo']}"
+
+    return {
+        'id': sample['id'],
+        'fname': FNAME_TEMPLATES[is_park].format(**fields),
+        'w': sample['w'], 'h': sample['h'],
+        'label1': LABEL1_TEMPLATES[is_park].format(**fields),
+        'label2': label2,
+        'anchors': sample['anchors'],
+        'steepBounds': sample['steepBounds'],
+        'isPark': is_park,
+    }
 
-    if 'green' in ranks:
-        # Parks: one per feature combo + any park
-        for feat in ['halfpipe+kickers', 'kickers+rails', 'kickers',
-                      'halfpipe+kickers+rails']:
-            targets.append({'rank': 'green', 'filterType': 'park', 'featureFilter': feat})
-        targets.append({'rank': 'green', 'filterType': 'park', 'featureFilter': None})
-        # Regular greens
-        targets.append({'rank': 'green', 'filterType': 'regular', 'featureFilter': None})
 
-    if 'blue' in ranks:
-        for shape in ['gentle_curve', 'winding', 'dogleg']:
-            targets.append({'rank': 'blue', 'filterType': shape, 'featureFilter': None})
+def write_png(out_dir: str, rendered: dict) -> str:
+    """Decode one BATCH_RENDER_JS data URL to `<fname>.png`; returns fname."""
+    path = os.path.join(out_dir, f"{rendered['fname']}.png")
+    with open(path, 'wb') as f:
+        f.write(base64.b64decode(rendered['dataUrl'].split(',', 1)[1]))
+    return rendered['fname']
 
-    if 'red' in ranks:
-        for shape in ['serpentine', 'hourglass', 'winding']:
-            targets.append({'rank': 'red', 'filterType': shape, 'featureFilter': None})
 
-    if 'black' in ranks:
-        for shape in ['serpentine', 'dogleg', 'hourglass', 'winding']:
-            targets.append({'rank': 'black', 'filterType': shape, 'featureFilter': None})
+def render_targets(targets: list[dict], max_seed: int, samples: int, out_dir: str,
+                   force: bool = False) -> int:
+    """Generate and render previews for `targets` in a browser of its own.
 
-    return targets
+    Each call starts its own Playwright instance, so calls can run on
+    separate threads. Unless `force` is set, samples whose PNG already
+    exists in `out_dir` are not rendered. Returns the number of previews written.
+    """
+    with sync_playwright() as p:
+        browser = p.chromium.launch()
+        page = browser.new_page(viewport={'width': 1280, 'height': 900})
+        # Level generation is pure, so the page only has to be on the dev
+        # server's origin for the /src imports; no progress unlock or
+        # scene navigation is needed
+        page.goto(GAME_URL)
+        page.evaluate(SETUP_IMPORTS)
+
+        # Generate all level data
+        levels = page.evaluate(GENERATE_LEVELS_JS, {
+            'targets': targets,
+            'maxSeed': max_seed,
+            'samplesPerTarget': samples,
+        })
+
+        print(f'Generated {len(levels)} level previews')
+
+        # File names are deterministic, so previews already on disk can be
+        # left out of the batch; render the rest in one evaluate
+        jobs = [render_job(sample) for sample in levels]
+        if not force:
+            jobs = [j for j in jobs
+                    if not os.path.exists(os.path.join(out_dir, f"{j['fname']}.png"))]
+            if len(jobs) < len(levels):
+                print(f'  {len(levels) - len(jobs)} already on disk, skipped (--force to redo)')
+        rendered = page.evaluate(BATCH_RENDER_JS, jobs) if jobs else []
+        browser.close()
+
+    # Decode and write the PNGs in parallel once the browser is closed
+    with ThreadPoolExecutor() as pool:
+        for fname in pool.map(lambda r: write_png(out_dir, r), rendered):
+            print(f'  ✓ {fname}')
+    return len(rendered)
 
 
 def main():
@@ -363,6 +507,10 @@ def main():
                         help='Max seeds to scan per target')
     parser.add_argument('--samples', type=int, default=5,
                         help='Number of samples per target shape/combo')
+    parser.add_argument('--workers', type=int, default=MAX_WORKERS,
+                        help='Browsers to split the targets across')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-render previews that already exist in --out')
     args = parser.parse_args()
 
     ranks = [r.strip() for r in args.ranks.split(',')]
@@ -374,100 +522,20 @@ def main():
         print('No targets to generate.')
         return
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch()
-        page = browser.new_page(viewport={'width': 1280, 'height': 900})
-        page.goto(GAME_URL)
-        wait_for_scene(page, 'MenuScene', timeout=15000)
-
-        # Unlock daily runs
-        page.evaluate("""() => {
-            const stats = {};
-            for (let i = 0; i <= 10; i++)
-                stats[i] = {completed: true, bestStars: 3, bestTime: 60, bestBonusMet: 0};
-            localStorage.setItem('snowGroomer_progress', JSON.stringify({
-                currentLevel: 11, levelStats: stats,
-                savedAt: new Date().toISOString()
-            }));
-        }""")
-        page.reload()
-        wait_for_scene(page, 'MenuScene', timeout=15000)
-        time.sleep(0.3)
-
-        # Navigate to DailyRunsScene (needed for dynamic imports)
-        idx = page.evaluate("""() => {
-            const ms = window.game?.scene?.getScene('MenuScene');
-            if (!ms?.menuButtons) return -1;
-            const texts = ms.menuButtons.map(b => b.text.toLowerCase());
-            for (let i = 0; i < texts.length; i++) {
-                if (texts[i].includes('daily') || texts[i].includes('contrat') ||
-                    texts[i].includes('courses') || texts[i].includes('runs')) return i;
-            }
-            return -1;
-        }""")
-        assert idx >= 0, 'Daily Runs button not found'
-        page.evaluate(f"""() => {{
-            const ms = window.game?.scene?.getScene('MenuScene');
-            if (ms?.buttonNav) ms.buttonNav.select({idx});
-        }}""")
-        time.sleep(0.2)
-        page.keyboard.press('Enter')
-        wait_for_scene(page, 'DailyRunsScene')
-        time.sleep(0.3)
-
-        # Import game modules
-        page.evaluate(SETUP_IMPORTS)
-        time.sleep(0.5)
-
-        # Generate all level data
-        levels = page.evaluate(GENERATE_LEVELS_JS, {
-            'targets': targets,
-            'maxSeed': args.count,
-            'samplesPerTarget': args.samples,
-        })
-
-        print(f'Generated {len(levels)} level previews')
-
-        # Render each level to a screenshot
-        for sample in levels:
-            park_tag = 'park_' if sample['isPark'] else ''
-            fkey = sample['features'].replace('+', '_') if sample['isPark'] else sample['shape']
-            fname = f"{sample['rank']}_{park_tag}{fkey}_s{sample['seed']}"
-
-            label1 = sample['rank'].upper()
-            if sample['isPark']:
-                label1 += f" PARK ({sample['features']})"
-            label1 += f" — {sample['shape']} {sample['w']}x{sample['h']}"
-
-            parts = [f"pw={sample['pw']}% cov={sample['coverage']}% t={sample['time']}s"]
-            if sample['steepInfo']:
-                parts.append(f"steep=[{sample['steepInfo']}]")
-            if sample['slalomInfo']:
-                parts.append(f"slalom={sample['slalomInfo']}")
-            label2 = ' | '.join(parts)
-
-            page.evaluate(RENDER_JS, {
-                'pixels': sample['pixels'],
-                'roadCurves': sample['roadCurves'],
-                'parkFeatures': sample['parkFeatures'],
-                'slalomGates': sample['slalomGates'],
-                'w': sample['w'], 'h': sample['h'],
-                'label1': label1, 'label2': label2,
-                'anchors': sample['anchors'],
-                'steepBounds': sample['steepBounds'],
-                'isPark': sample['isPark'],
-            })
-            time.sleep(0.1)
-            canvas = page.locator('#__auditCanvas')
-            path = os.path.join(out_dir, f'{fname}.png')
-            canvas.screenshot(path=path)
-            print(f'  ✓ {fname}')
-
-        # Cleanup
-        page.evaluate("() => { const c = document.getElementById('__auditCanvas'); if (c) c.remove(); }")
-        browser.close()
-
-    print(f'\nDone! {len(levels)} previews saved to {out_dir}/')
+    # Seed scanning is CPU-bound in each page. Keep each rank's targets in
+    # one browser so its seeds are generated once for all of them, and
+    # deal the ranks round-robin across browsers
+    by_rank: dict[str, list[dict]] = {}
+    for t in targets:
+        by_rank.setdefault(t['rank'], []).append(t)
+    groups = list(by_rank.values())
+    workers = max(1, min(args.workers, len(groups)))
+    slices = [[t for g in groups[i::workers] for t in g] for i in range(workers)]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        total = sum(pool.map(
+            lambda chunk: render_targets(chunk, args.count, args.samples, out_dir, args.force), slices))
+
+    print(f'\nDone! {total} previews saved to {out_dir}/')
 
 
 if __name__ == '__main__':
@@ -8,16 +8,31 @@ Tests every accessibility setting across key scenes and form factors:
 - Screen reader announcer element
 - Responsive form factors (phone, tablet, desktop)
 """
+import json
+
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page
+from playwright.sync_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
 from conftest import (
-    GAME_URL, wait_for_game_ready, wait_for_scene,
+    open_game, wait_for_scene,
     click_button, assert_scene_active, assert_canvas_renders_content,
     navigate_to_settings, dismiss_dialogues,
-    BUTTON_START,
+    new_game_context, BUTTON_START,
 )
 
 SCREENSHOT_DIR = "tests/screenshots"
+DEFAULT_VIEWPORT = {"width": 1280, "height": 720}
+
+# JS expression for the stored accessibility settings, parsed once per evaluate
+A11Y_READ_JS = "JSON.parse(localStorage.getItem('snowGroomer_accessibility') || '{}')"
+
+# Seeds accessibility settings before the game's first load in a tab only;
+# sessionStorage survives reloads, so a reload keeps later changes made
+# through apply_and_verify_settings
+_SEED_A11Y_JS = """(() => {
+    if (sessionStorage.getItem('__a11ySeeded')) return;
+    localStorage.setItem('snowGroomer_accessibility', %s);
+    sessionStorage.setItem('__a11ySeeded', '1');
+})();"""
 
 
 @pytest.fixture(autouse=True)
@@ -26,83 +41,79 @@ def skip_prologue():
     return
 
 
-@pytest.fixture(scope="module")
-def module_context(browser: Browser) -> BrowserContext:
-    """Reuse one context for this module to reduce browser setup overhead."""
-    context = browser.new_context(viewport={"width": 1280, "height": 720})
-    context.add_init_script("localStorage.setItem('snowGroomer_prologueSeen', '1');")
-    yield context
-    context.close()
+@pytest.fixture(scope="session")
+def viewport_contexts(browser: Browser, a11y_context: BrowserContext):
+    """Contexts keyed by viewport size, created on first use per worker.
+
+    The default size reuses a11y_context, so every size keeps one warm
+    HTTP cache for the whole run.
+    """
+    contexts = {(DEFAULT_VIEWPORT["width"], DEFAULT_VIEWPORT["height"]): a11y_context}
+    owned = []
+
+    def get(viewport: dict) -> BrowserContext:
+        key = (viewport["width"], viewport["height"])
+        if key not in contexts:
+            contexts[key] = new_game_context(browser, viewport)
+            owned.append(contexts[key])
+        return contexts[key]
+
+    yield get
+    for context in owned:
+        context.close()
 
 
 @pytest.fixture
-def game_page(module_context: BrowserContext):
+def game_page(a11y_context: BrowserContext):
     """Fresh page per test from shared context, with clean game boot."""
-    page = module_context.new_page()
-    page.goto(GAME_URL)
-    page.wait_for_selector("canvas", timeout=10000)
-    wait_for_game_ready(page)
+    page = a11y_context.new_page()
+    open_game(page)
     yield page
     page.evaluate("localStorage.clear()")
     page.close()
 
 
-# ── Helpers ──────────────────────────────────────────────────────────
-
+@pytest.fixture
+def a11y_page(viewport_contexts):
+    """Factory: open the game with accessibility settings already in localStorage.
 
-def set_accessibility(page: Page, **kwargs):
-    """Set accessibility settings via JS and apply DOM changes.
-    
-    Accepts: highContrast, colorblindMode, reducedMotion, uiScale
+    Pages come from the shared context for their viewport and get the
+    settings from a page init script, so the first boot already runs with
+    them and no reload or resize is needed.
     """
-    settings_js = ", ".join(f"'{k}': {_js_val(v)}" for k, v in kwargs.items())
-    page.evaluate(f"""() => {{
-        const a = window.__accessibility || (() => {{
-            const mod = window.game?.registry?.get('accessibility');
-            return mod;
-        }})();
-        // Direct localStorage approach — works regardless of module exposure
-        const key = 'snowGroomer_accessibility';
-        const current = JSON.parse(localStorage.getItem(key) || '{{}}');
-        const updates = {{ {settings_js} }};
-        Object.assign(current, updates);
-        localStorage.setItem(key, JSON.stringify(current));
-    }}""")
-    # Reload settings in the live Accessibility module
-    page.evaluate("""() => {
-        const game = window.game;
-        if (!game) return;
-        // Accessibility module is imported; use eval to reach it via settings scene
-        const ss = game.scene.getScene('SettingsScene');
-        const gs = game.scene.getScene('GameScene');
-        // Force all scenes to reload accessibility from localStorage
-        const key = 'snowGroomer_accessibility';
-        const saved = JSON.parse(localStorage.getItem(key) || '{}');
-        // Walk all scenes to find one that has Accessibility imported
-        for (const scene of game.scene.getScenes(false)) {
-            if (scene.sys && scene.sys.settings) {
-                // Trigger accessibility reload via game event
-                break;
-            }
-        }
-    }""")
+    pages = []
 
+    def open_page(viewport: dict | None = None, **settings) -> Page:
+        page = viewport_contexts(viewport or DEFAULT_VIEWPORT).new_page()
+        page.add_init_script(_SEED_A11Y_JS % json.dumps(json.dumps(settings)))
+        pages.append(page)
+        open_game(page)
+        return page
 
-def _js_val(v):
-    if isinstance(v, bool):
-        return 'true' if v else 'false'
-    if isinstance(v, str):
-        return f"'{v}'"
-    return str(v)
+    yield open_page
+    for page in pages:
+        page.evaluate("localStorage.clear()")
+        page.close()
+
+
+# ── Helpers ──────────────────────────────────────────────────────────
 
 
 def apply_and_verify_settings(page: Page, **kwargs):
-    """Set accessibility settings, start a scene, and verify they take effect."""
-    set_accessibility(page, **kwargs)
-    # Reload page to pick up localStorage settings cleanly
-    page.reload()
-    page.wait_for_selector("canvas", timeout=10000)
-    wait_for_scene(page, 'MenuScene', timeout=10000)
+    """Merge accessibility settings into localStorage and apply them live.
+
+    Accepts: highContrast, colorblindMode, reducedMotion, uiScale.
+    Reloads the live Accessibility module and its DOM filters in the same
+    evaluate, so no page reload is needed. Tests that only need a starting
+    configuration should open the page with `a11y_page(**settings)` instead.
+    """
+    page.evaluate("""(updates) => {
+        const key = 'snowGroomer_accessibility';
+        const current = JSON.parse(localStorage.getItem(key) || '{}');
+        localStorage.setItem(key, JSON.stringify(Object.assign(current, updates)));
+        window.Accessibility.loadSettings();
+        window.Accessibility.applyDOMSettings();
+    }""", kwargs)
 
 
 def start_game_and_wait(page: Page):
@@ -113,6 +124,61 @@ def start_game_and_wait(page: Page):
     wait_for_scene(page, 'HUDScene')
 
 
+def probe_a11y(page: Page) -> dict:
+    """Collect every DOM/HUD accessibility observable in one evaluate.
+
+    `hud` is None without a HUDScene; its `coverage` holds the coverage text
+    stroke (None if absent), `visorAlpha` is the first Rectangle's alpha
+    (-1 if none) and `labelCount` counts "F"/"S" bar labels.
+    """
+    return page.evaluate("""() => {
+        const canvas = document.querySelector('#game-container canvas');
+        const hud = window.game?.scene?.getScene('HUDScene');
+        let hudData = null;
+        if (hud) {
+            const rects = hud.children.list.filter(c => c.type === 'Rectangle');
+            const texts = hud.children.list.filter(c => c.type === 'Text');
+            hudData = {
+                coverage: hud.coverageText ? {
+                    stroke: hud.coverageText.style?.stroke || '',
+                    strokeThickness: hud.coverageText.style?.strokeThickness || 0,
+                } : null,
+                visorAlpha: rects.length > 0 ? rects[0].alpha : -1,
+                labelCount: texts.filter(t => t.text === 'F' || t.text === 'S').length,
+            };
+        }
+        return {
+            bodyHighContrast: document.body.classList.contains('high-contrast'),
+            canvasFilter: canvas ? canvas.style.filter : '',
+            svgFilters: document.getElementById('colorblind-filters') !== null,
+            stored: """ + A11Y_READ_JS + """,
+            hud: hudData,
+        };
+    }""")
+
+
+def get_stored_a11y(page: Page) -> dict:
+    """Return the accessibility settings saved in localStorage ({} if none)."""
+    return page.evaluate("() => " + A11Y_READ_JS)
+
+
+def settings_has_text(page: Page, needles: list[str], timeout: int = 3000) -> bool:
+    """Wait until a SettingsScene Text contains any of `needles`.
+
+    The check runs in the page each frame and only a boolean comes back;
+    returns False if nothing matches within `timeout` ms.
+    """
+    try:
+        page.wait_for_function("""(needles) => {
+            const ss = window.game?.scene?.getScene('SettingsScene');
+            return !!ss && ss.children.list.some(c =>
+                c.type === 'Text' && c.text && needles.some(n => c.text.includes(n)));
+        }""", arg=needles, timeout=timeout)
+        return True
+    except PlaywrightTimeout:
+        return False
+
+
 def screenshot(page: Page, name: str):
     """Save a screenshot with the given name."""
     page.screenshot(path=f"{SCREENSHOT_DIR}/a11y_{name}.png")
@@ -131,94 +197,72 @@ VIEWPORTS = {
 class TestHighContrast:
     """Verify high contrast mode across scenes."""
 
-    def test_high_contrast_adds_body_class(self, game_page: Page):
+    def test_high_contrast_adds_body_class(self, a11y_page):
         """Enabling high contrast should add 'high-contrast' class to body."""
-        apply_and_verify_settings(game_page, highContrast=True)
+        page = a11y_page(highContrast=True)
         # Start game to trigger applyDOMSettings via Accessibility.loadSettings()
-        start_game_and_wait(game_page)
-        has_class = game_page.evaluate(
-            "() => document.body.classList.contains('high-contrast')"
-        )
-        assert has_class, "Body should have 'high-contrast' class"
-        screenshot(game_page, "high_contrast_menu")
+        start_game_and_wait(page)
+        probe = probe_a11y(page)
+        assert probe['bodyHighContrast'], "Body should have 'high-contrast' class"
+        screenshot(page, "high_contrast_menu")
 
-    def test_high_contrast_canvas_filter(self, game_page: Page):
+    def test_high_contrast_canvas_filter(self, a11y_page):
         """High contrast should apply contrast+saturate CSS filter to the canvas."""
-        apply_and_verify_settings(game_page, highContrast=True)
-        start_game_and_wait(game_page)
+        page = a11y_page(highContrast=True)
+        start_game_and_wait(page)
 
-        filter_value = game_page.evaluate("""() => {
-            const canvas = document.querySelector('#game-container canvas');
-            return canvas ? canvas.style.filter : '';
-        }""")
+        filter_value = probe_a11y(page)['canvasFilter']
         assert 'contrast' in filter_value, \
             f"Canvas should have contrast() filter, got '{filter_value}'"
         assert 'saturate' in filter_value, \
             f"Canvas should have saturate() filter, got '{filter_value}'"
 
-    def test_high_contrast_no_filter_when_off(self, game_page: Page):
+    def test_high_contrast_no_filter_when_off(self, a11y_page):
         """Without high contrast, canvas should not have contrast filter."""
-        apply_and_verify_settings(game_page, highContrast=False, colorblindMode='none')
-        start_game_and_wait(game_page)
+        page = a11y_page(highContrast=False, colorblindMode='none')
+        start_game_and_wait(page)
 
-        filter_value = game_page.evaluate("""() => {
-            const canvas = document.querySelector('#game-container canvas');
-            return canvas ? canvas.style.filter : '';
-        }""")
+        filter_value = probe_a11y(page)['canvasFilter']
         assert 'contrast' not in filter_value, \
             f"Canvas should NOT have contrast filter when HC off, got '{filter_value}'"
 
-    def test_high_contrast_removes_class_when_off(self, game_page: Page):
+    def test_high_contrast_removes_class_when_off(self, a11y_page):
         """Disabling high contrast should remove the class."""
-        apply_and_verify_settings(game_page, highContrast=True)
-        apply_and_verify_settings(game_page, highContrast=False)
-        start_game_and_wait(game_page)
-        has_class = game_page.evaluate(
-            "() => document.body.classList.contains('high-contrast')"
-        )
-        assert not has_class, "Body should NOT have 'high-contrast' class"
+        page = a11y_page(highContrast=True)
+        apply_and_verify_settings(page, highContrast=False)
+        start_game_and_wait(page)
+        probe = probe_a11y(page)
+        assert not probe['bodyHighContrast'], "Body should NOT have 'high-contrast' class"
 
-    def test_high_contrast_hud_thicker_stroke(self, game_page: Page):
+    def test_high_contrast_hud_thicker_stroke(self, a11y_page):
         """HUD text should have stroke in high contrast mode."""
-        apply_and_verify_settings(game_page, highContrast=True)
-        start_game_and_wait(game_page)
-        assert_scene_active(game_page, 'HUDScene')
-
-        hud_data = game_page.evaluate("""() => {
-            const hud = window.game.scene.getScene('HUDScene');
-            if (!hud || !hud.coverageText) return null;
-            return {
-                stroke: hud.coverageText.style?.stroke || '',
-                strokeThickness: hud.coverageText.style?.strokeThickness || 0,
-            };
-        }""")
+        page = a11y_page(highContrast=True)
+        start_game_and_wait(page)
+        assert_scene_active(page, 'HUDScene')
+
+        hud_data = (probe_a11y(page)['hud'] or {}).get('coverage')
         assert hud_data is not None, "HUDScene should have coverageText"
         assert hud_data['strokeThickness'] >= 2, \
             f"High contrast HUD text should have stroke thickness >= 2, got {hud_data['strokeThickness']}"
-        screenshot(game_page, "high_contrast_hud")
+        screenshot(page, "high_contrast_hud")
 
-    def test_high_contrast_visor_alpha(self, game_page: Page):
+    def test_high_contrast_visor_alpha(self, a11y_page):
         """HUD visor should have higher alpha in high contrast mode."""
-        apply_and_verify_settings(game_page, highContrast=True)
-        start_game_and_wait(game_page)
+        page = a11y_page(highContrast=True)
+        start_game_and_wait(page)
 
         # The visor rectangle is the first rectangle added, at alpha 0.80
-        visor_alpha = game_page.evaluate("""() => {
-            const hud = window.game.scene.getScene('HUDScene');
-            if (!hud) return -1;
-            // First rectangle in display list is the visor background
-            const rects = hud.children.list.filter(c => c.type === 'Rectangle');
-            return rects.length > 0 ? rects[0].alpha : -1;
-        }""")
+        hud = probe_a11y(page)['hud']
+        visor_alpha = hud['visorAlpha'] if hud else -1
         assert visor_alpha >= 0.75, \
             f"High contrast visor alpha should be >= 0.75, got {visor_alpha}"
 
-    def test_high_contrast_gameplay_screenshot(self, game_page: Page):
+    def test_high_contrast_gameplay_screenshot(self, a11y_page):
         """Visual check: gameplay with high contrast enabled."""
-        apply_and_verify_settings(game_page, highContrast=True)
-        start_game_and_wait(game_page)
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, "high_contrast_gameplay")
+        page = a11y_page(highContrast=True)
+        start_game_and_wait(page)
+        assert_canvas_renders_content(page)
+        screenshot(page, "high_contrast_gameplay")
 
 
 # ── Colorblind Mode Tests ───────────────────────────────────────────
@@ -228,68 +272,50 @@ class TestColorblindModes:
     """Verify all three colorblind filter modes."""
 
     @pytest.mark.parametrize("mode", ['deuteranopia', 'protanopia', 'tritanopia'])
-    def test_colorblind_filter_applied_to_canvas(self, game_page: Page, mode: str):
+    def test_colorblind_filter_applied_to_canvas(self, a11y_page, mode: str):
         """Each colorblind mode should apply an SVG filter to the canvas."""
-        apply_and_verify_settings(game_page, colorblindMode=mode)
+        page = a11y_page(colorblindMode=mode)
 
         # Navigate to game to trigger applyDOMSettings
-        start_game_and_wait(game_page)
+        start_game_and_wait(page)
 
-        filter_value = game_page.evaluate("""() => {
-            const canvas = document.querySelector('#game-container canvas');
-            return canvas ? canvas.style.filter : '';
-        }""")
+        probe = probe_a11y(page)
+        filter_value = probe['canvasFilter']
         # Browsers may serialize as url(#id) or url("#id")
         assert f'{mode}-filter' in filter_value, \
             f"Canvas filter should reference '{mode}-filter', got '{filter_value}'"
 
         # SVG filter element should exist
-        svg_exists = game_page.evaluate(
-            "() => document.getElementById('colorblind-filters') !== null"
-        )
-        assert svg_exists, "Colorblind SVG filters should be injected into DOM"
-        screenshot(game_page, f"colorblind_{mode}_gameplay")
+        assert probe['svgFilters'], "Colorblind SVG filters should be injected into DOM"
+        screenshot(page, f"colorblind_{mode}_gameplay")
 
-    def test_colorblind_none_removes_filter(self, game_page: Page):
+    def test_colorblind_none_removes_filter(self, a11y_page):
         """Setting colorblind mode to 'none' should remove canvas filter."""
-        apply_and_verify_settings(game_page, colorblindMode='deuteranopia')
-        apply_and_verify_settings(game_page, colorblindMode='none')
-        start_game_and_wait(game_page)
+        page = a11y_page(colorblindMode='deuteranopia')
+        apply_and_verify_settings(page, colorblindMode='none')
+        start_game_and_wait(page)
 
-        filter_value = game_page.evaluate("""() => {
-            const canvas = document.querySelector('#game-container canvas');
-            return canvas ? canvas.style.filter : '';
-        }""")
+        filter_value = probe_a11y(page)['canvasFilter']
         assert filter_value == '' or 'filter' not in filter_value, \
             f"Canvas filter should be empty when colorblind mode is 'none', got '{filter_value}'"
 
-    def test_colorblind_hud_text_labels(self, game_page: Page):
+    def test_colorblind_hud_text_labels(self, a11y_page):
         """In colorblind mode, HUD should show text labels ("F"/"S") instead of colored dots."""
-        apply_and_verify_settings(game_page, colorblindMode='deuteranopia')
-        start_game_and_wait(game_page)
+        page = a11y_page(colorblindMode='deuteranopia')
+        start_game_and_wait(page)
 
-        has_labels = game_page.evaluate("""() => {
-            const hud = window.game.scene.getScene('HUDScene');
-            if (!hud) return false;
-            // Look for text objects with content "F" or "S" 
-            const texts = hud.children.list.filter(c => c.type === 'Text');
-            const labels = texts.filter(t => t.text === 'F' || t.text === 'S');
-            return labels.length >= 2;
-        }""")
+        hud = probe_a11y(page)['hud']
+        has_labels = bool(hud) and hud['labelCount'] >= 2
         assert has_labels, "HUD should have 'F' and 'S' text labels in colorblind mode"
-        screenshot(game_page, "colorblind_hud_labels")
+        screenshot(page, "colorblind_hud_labels")
 
-    def test_colorblind_hud_no_labels_when_off(self, game_page: Page):
+    def test_colorblind_hud_no_labels_when_off(self, a11y_page):
         """Without colorblind mode, HUD should NOT have text labels for bars."""
-        apply_and_verify_settings(game_page, colorblindMode='none')
-        start_game_and_wait(game_page)
+        page = a11y_page(colorblindMode='none')
+        start_game_and_wait(page)
 
-        label_count = game_page.evaluate("""() => {
-            const hud = window.game.scene.getScene('HUDScene');
-            if (!hud) return 0;
-            const texts = hud.children.list.filter(c => c.type === 'Text');
-            return texts.filter(t => t.text === 'F' || t.text === 'S').length;
-        }""")
+        hud = probe_a11y(page)['hud']
+        label_count = hud['labelCount'] if hud else 0
         assert label_count == 0, \
             f"HUD should NOT have F/S labels when colorblind mode is off, found {label_count}"
 
@@ -303,27 +329,22 @@ class TestReducedMotion:
     def test_reduced_motion_persists(self, game_page: Page):
         """Reduced motion setting should persist in localStorage."""
         apply_and_verify_settings(game_page, reducedMotion=True)
-        stored = game_page.evaluate("""() => {
-            const data = JSON.parse(localStorage.getItem('snowGroomer_accessibility') || '{}');
-            return data.reducedMotion;
-        }""")
+        stored = get_stored_a11y(game_page).get('reducedMotion')
         assert stored is True, "reducedMotion should be stored as true"
 
-    def test_reduced_motion_disables_weather_particles(self, game_page: Page):
+    def test_reduced_motion_disables_weather_particles(self, a11y_page):
         """With reduced motion, weather system should not create particles."""
-        apply_and_verify_settings(game_page, reducedMotion=True)
-        start_game_and_wait(game_page)
+        page = a11y_page(reducedMotion=True)
+        start_game_and_wait(page)
 
-        weather_disabled = game_page.evaluate("""() => {
+        weather_disabled = page.evaluate("""() => {
             const gs = window.game.scene.getScene('GameScene');
             if (!gs) return null;
             // WeatherSystem checks reducedMotion at update time
-            const key = 'snowGroomer_accessibility';
-            const saved = JSON.parse(localStorage.getItem(key) || '{}');
-            return saved.reducedMotion === true;
+            return """ + A11Y_READ_JS + """.reducedMotion === true;
         }""")
         assert weather_disabled is True, "Reduced motion should be active"
-        screenshot(game_page, "reduced_motion_gameplay")
+        screenshot(page, "reduced_motion_gameplay")
 
 
 # ── Screen Reader / ARIA Tests ──────────────────────────────────────
@@ -355,62 +376,23 @@ class TestScreenReader:
 class TestSettingsAccessibilityUI:
     """Verify accessibility controls render correctly in Settings."""
 
-    def test_settings_shows_accessibility_section(self, game_page: Page):
-        """Settings scene should have the accessibility section."""
+    # Needles per control; any one matching a Text covers the supported locales
+    CONTROLS = {
+        'Accessibility section header': ['ccessib'],
+        'High Contrast toggle': ['ontrast', 'Kontrast', 'ontraste', 'kontrast'],
+        'Reduced Motion toggle': ['otion', 'ouvement', 'ewegung', 'ovimiento'],
+        'Colorblind mode selector': ['olorblind', 'altonism', 'arv', 'örlüğü'],
+    }
+
+    def test_settings_shows_accessibility_controls(self, game_page: Page):
+        """Settings should show the accessibility header and all its controls."""
         navigate_to_settings(game_page)
         assert_scene_active(game_page, 'SettingsScene')
-
-        has_section = game_page.evaluate("""() => {
-            const ss = window.game.scene.getScene('SettingsScene');
-            if (!ss) return false;
-            const texts = ss.children.list.filter(c => c.type === 'Text');
-            return texts.some(t => t.text && t.text.includes('ccessib'));
-        }""")
-        assert has_section, "Settings should display Accessibility section header"
+        missing = [name for name, needles in self.CONTROLS.items()
+                   if not settings_has_text(game_page, needles)]
+        assert not missing, f"Settings should display: {', '.join(missing)}"
         screenshot(game_page, "settings_a11y_section")
 
-    def test_settings_has_high_contrast_toggle(self, game_page: Page):
-        """Settings should have a High Contrast toggle."""
-        navigate_to_settings(game_page)
-        has_toggle = game_page.evaluate("""() => {
-            const ss = window.game.scene.getScene('SettingsScene');
-            if (!ss) return false;
-            const texts = ss.children.list.filter(c => c.type === 'Text');
-            return texts.some(t => t.text && (
-                t.text.includes('ontrast') || t.text.includes('Kontrast') || 
-                t.text.includes('ontraste') || t.text.includes('kontrast')
-            ));
-        }""")
-        assert has_toggle, "Settings should display High Contrast toggle"
-
-    def test_settings_has_reduced_motion_toggle(self, game_page: Page):
-        """Settings should have a Reduced Motion toggle."""
-        navigate_to_settings(game_page)
-        has_toggle = game_page.evaluate("""() => {
-            const ss = window.game.scene.getScene('SettingsScene');
-            if (!ss) return false;
-            const texts = ss.children.list.filter(c => c.type === 'Text');
-            return texts.some(t => t.text && (
-                t.text.includes('otion') || t.text.includes('ouvement') || 
-                t.text.includes('ewegung') || t.text.includes('ovimiento')
-            ));
-        }""")
-        assert has_toggle, "Settings should display Reduced Motion toggle"
-
-    def test_settings_has_colorblind_selector(self, game_page: Page):
-        """Settings should have colorblind mode buttons."""
-        navigate_to_settings(game_page)
-        has_selector = game_page.evaluate("""() => {
-            const ss = window.game.scene.getScene('SettingsScene');
-            if (!ss) return false;
-            const texts = ss.children.list.filter(c => c.type === 'Text');
-            return texts.some(t => t.text && (
-                t.text.includes('olorblind') || t.text.includes('altonism') ||
-                t.text.includes('arv') || t.text.includes('örlüğü')
-            ));
-        }""")
-        assert has_selector, "Settings should display Colorblind mode selector"
-
 
 # ── Form Factor / Responsive Tests ──────────────────────────────────
 
@@ -423,43 +405,38 @@ class TestResponsiveAccessibility:
         ('tablet',  {'width': 768,  'height': 1024}),
         ('desktop', {'width': 1280, 'height': 720}),
     ])
-    def test_settings_renders_at_viewport(self, game_page: Page, form: str, size: dict):
+    def test_settings_renders_at_viewport(self, a11y_page, form: str, size: dict):
         """Settings accessibility section should render at various viewport sizes."""
-        game_page.set_viewport_size(size)
-        game_page.reload()
-        game_page.wait_for_selector("canvas", timeout=10000)
-        wait_for_scene(game_page, 'MenuScene', timeout=10000)
-        navigate_to_settings(game_page)
-        assert_scene_active(game_page, 'SettingsScene')
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, f"settings_a11y_{form}")
+        page = a11y_page(viewport=size)
+        navigate_to_settings(page)
+        assert_scene_active(page, 'SettingsScene')
+        assert_canvas_renders_content(page)
+        screenshot(page, f"settings_a11y_{form}")
 
     @pytest.mark.parametrize("form,size", [
         ('phone',   {'width': 375,  'height': 667}),
         ('tablet',  {'width': 768,  'height': 1024}),
         ('desktop', {'width': 1280, 'height': 720}),
     ])
-    def test_high_contrast_hud_at_viewport(self, game_page: Page, form: str, size: dict):
+    def test_high_contrast_hud_at_viewport(self, a11y_page, form: str, size: dict):
         """High contrast HUD should render correctly at various viewport sizes."""
-        game_page.set_viewport_size(size)
-        apply_and_verify_settings(game_page, highContrast=True)
-        start_game_and_wait(game_page)
-        assert_scene_active(game_page, 'HUDScene')
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, f"hud_high_contrast_{form}")
+        page = a11y_page(viewport=size, highContrast=True)
+        start_game_and_wait(page)
+        assert_scene_active(page, 'HUDScene')
+        assert_canvas_renders_content(page)
+        screenshot(page, f"hud_high_contrast_{form}")
 
     @pytest.mark.parametrize("form,size", [
         ('phone',   {'width': 375,  'height': 667}),
         ('desktop', {'width': 1280, 'height': 720}),
     ])
-    def test_colorblind_hud_at_viewport(self, game_page: Page, form: str, size: dict):
+    def test_colorblind_hud_at_viewport(self, a11y_page, form: str, size: dict):
         """Colorblind HUD labels should render at various viewport sizes."""
-        game_page.set_viewport_size(size)
-        apply_and_verify_settings(game_page, colorblindMode='deuteranopia')
-        start_game_and_wait(game_page)
-        assert_scene_active(game_page, 'HUDScene')
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, f"hud_colorblind_{form}")
+        page = a11y_page(viewport=size, colorblindMode='deuteranopia')
+        start_game_and_wait(page)
+        assert_scene_active(page, 'HUDScene')
+        assert_canvas_renders_content(page)
+        screenshot(page, f"hud_colorblind_{form}")
 
 
 # ── Combined Mode Tests ─────────────────────────────────────────────
@@ -468,48 +445,32 @@ class TestResponsiveAccessibility:
 class TestCombinedAccessibility:
     """Test combinations of accessibility settings together."""
 
-    def test_high_contrast_plus_colorblind(self, game_page: Page):
+    def test_high_contrast_plus_colorblind(self, a11y_page):
         """Both high contrast and colorblind mode should work together."""
-        apply_and_verify_settings(game_page, highContrast=True, colorblindMode='protanopia')
-        start_game_and_wait(game_page)
-
-        result = game_page.evaluate("""() => {
-            const body_hc = document.body.classList.contains('high-contrast');
-            const canvas = document.querySelector('#game-container canvas');
-            const filter = canvas ? canvas.style.filter : '';
-            return { highContrast: body_hc, filter: filter };
-        }""")
-        assert result['highContrast'], "High contrast should be active"
-        assert 'protanopia' in result['filter'], "Protanopia filter should be applied"
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, "combined_hc_colorblind")
+        page = a11y_page(highContrast=True, colorblindMode='protanopia')
+        start_game_and_wait(page)
+
+        probe = probe_a11y(page)
+        assert probe['bodyHighContrast'], "High contrast should be active"
+        assert 'protanopia' in probe['canvasFilter'], "Protanopia filter should be applied"
+        assert_canvas_renders_content(page)
+        screenshot(page, "combined_hc_colorblind")
 
-    def test_all_accessibility_features_enabled(self, game_page: Page):
+    def test_all_accessibility_features_enabled(self, a11y_page):
         """All accessibility features enabled simultaneously."""
-        apply_and_verify_settings(
-            game_page,
+        page = a11y_page(
             highContrast=True,
             colorblindMode='tritanopia',
             reducedMotion=True,
         )
-        start_game_and_wait(game_page)
-
-        result = game_page.evaluate("""() => {
-            const body_hc = document.body.classList.contains('high-contrast');
-            const canvas = document.querySelector('#game-container canvas');
-            const filter = canvas ? canvas.style.filter : '';
-            const a11y = JSON.parse(localStorage.getItem('snowGroomer_accessibility') || '{}');
-            return {
-                highContrast: body_hc,
-                filter: filter,
-                reducedMotion: a11y.reducedMotion,
-            };
-        }""")
-        assert result['highContrast'], "High contrast should be active"
-        assert 'tritanopia' in result['filter'], "Tritanopia filter should be applied"
-        assert result['reducedMotion'] is True, "Reduced motion should be stored"
-        assert_canvas_renders_content(game_page)
-        screenshot(game_page, "all_a11y_enabled")
+        start_game_and_wait(page)
+
+        probe = probe_a11y(page)
+        assert probe['bodyHighContrast'], "High contrast should be active"
+        assert 'tritanopia' in probe['canvasFilter'], "Tritanopia filter should be applied"
+        assert probe['stored'].get('reducedMotion') is True, "Reduced motion should be stored"
+        assert_canvas_renders_content(page)
+        screenshot(page, "all_a11y_enabled")
 
 
 # ── Persistence Tests ────────────────────────────────────────────────
@@ -518,8 +479,13 @@ class TestCombinedAccessibility:
 class TestAccessibilityPersistence:
     """Verify settings survive page reload."""
 
-    def test_settings_persist_across_reload(self, game_page: Page):
-        """Accessibility settings should persist after page reload."""
+    def test_settings_default_off_then_persist_across_reload(self, game_page: Page):
+        """Settings start disabled on a fresh boot and persist after reload."""
+        # Clean boot: nothing stored, or everything false/none
+        stored = get_stored_a11y(game_page)
+        assert stored.get('highContrast', False) is False
+        assert stored.get('colorblindMode', 'none') in ('none', None)
+
         apply_and_verify_settings(
             game_page,
             highContrast=True,
@@ -531,20 +497,7 @@ class TestAccessibilityPersistence:
         game_page.wait_for_selector("canvas", timeout=10000)
         wait_for_scene(game_page, 'MenuScene', timeout=10000)
 
-        stored = game_page.evaluate("""() => {
-            const data = JSON.parse(localStorage.getItem('snowGroomer_accessibility') || '{}');
-            return data;
-        }""")
+        stored = get_stored_a11y(game_page)
         assert stored.get('highContrast') is True
         assert stored.get('colorblindMode') == 'deuteranopia'
         assert stored.get('reducedMotion') is True
-
-    def test_default_settings_are_off(self, game_page: Page):
-        """Default accessibility settings should all be disabled."""
-        stored = game_page.evaluate("""() => {
-            const data = JSON.parse(localStorage.getItem('snowGroomer_accessibility') || '{}');
-            return data;
-        }""")
-        # Either empty or all false/none
-        assert stored.get('highContrast', False) is False
-        assert stored.get('colorblindMode', 'none') in ('none', None)
@@ -4,10 +4,10 @@ Tests navigation, input methods (keyboard, mouse, gamepad), viewports,
 and cross-scene flows specific to the daily runs feature.
 """
 import pytest
-from playwright.sync_api import Browser, BrowserContext, Page
+from playwright.sync_api import Browser, BrowserContext, Page, TimeoutError as PlaywrightTimeout
 from conftest import (
     wait_for_scene, get_active_scenes, GAME_URL, navigate_to_daily_runs,
-    unlock_all_levels, click_menu_by_key,
+    seed_unlocked_progress, click_menu_by_key, new_game_context,
 )
 from test_gamepad import tap_gamepad_button, MOCK_GAMEPAD_SCRIPT
 
@@ -19,64 +19,105 @@ GP_DPAD_DOWN = 13
 
 
 def setup_unlocked(page: Page, width: int = 1280, height: int = 720):
-    """Load game, unlock all levels, reload so menu reflects progress."""
+    """Load game with all levels unlocked from the first boot."""
     page.set_viewport_size({"width": width, "height": height})
+    seed_unlocked_progress(page)
     page.goto(GAME_URL)
     wait_for_scene(page, "MenuScene", timeout=15000)
-    unlock_all_levels(page)
-    page.reload()
-    wait_for_scene(page, "MenuScene", timeout=15000)
 
 
 def wait_for_scene_ready(page: Page, scene: str, timeout: int = 8000):
-    """Wait for scene to be active AND inputReady (if it has that guard)."""
-    wait_for_scene(page, scene, timeout)
+    """Wait for scene to be active AND inputReady (if it has that guard).
+
+    One raf-polled wait covers both conditions, so callers pay a single
+    round trip instead of a scene wait followed by an input wait.
+    """
     page.wait_for_function(
-        f"""() => {{
-            const s = window.game?.scene?.getScene('{scene}');
+        """(scene) => {
+            const s = window.game?.scene?.getScene(scene);
             if (!s || !s.sys?.isActive()) return false;
             if ('inputReady' in s) return s.inputReady === true;
             return true;
-        }}""",
-        timeout=5000,
+        }""",
+        arg=scene,
+        timeout=timeout,
+        polling='raf',
     )
 
 
-def dismiss_dialogues(page: Page):
-    """Suppress all current and future dialogues."""
-    page.evaluate("""() => {
+def dismiss_dialogues(page: Page, timeout: int = 3000):
+    """Suppress all current and future dialogues.
+
+    Patches and waits for the hide in one evaluate, like conftest's
+    dismiss_dialogues, so each daily-run start costs a single round trip.
+    """
+    page.evaluate("""async (timeout) => {
         const ds = window.game?.scene?.getScene('DialogueScene');
         if (!ds) return;
         if (ds.dialogueQueue) ds.dialogueQueue = [];
-        if (ds.isDialogueShowing && ds.isDialogueShowing() && ds.hideDialogue) ds.hideDialogue();
         ds.showDialogue = function() {};
-    }""")
-    page.wait_for_function("""() => {
-        const ds = window.game?.scene?.getScene('DialogueScene');
-        return !ds || !ds.isDialogueShowing || !ds.isDialogueShowing();
-    }""", timeout=3000)
+        if (!ds.isDialogueShowing || !ds.isDialogueShowing()) return;
+        if (ds.hideDialogue) ds.hideDialogue();
+        const deadline = performance.now() + timeout;
+        await new Promise((resolve, reject) => {
+            const check = () => {
+                if (!ds.isDialogueShowing()) resolve();
+                else if (performance.now() > deadline) reject(new Error(`Timeout ${timeout}ms waiting for dialogue to hide`));
+                else requestAnimationFrame(check);
+            };
+            check();
+        });
+    }""", timeout)
 
 
 def get_selected_index(page: Page, scene: str) -> int:
-    return page.evaluate(f"""() => {{
-        const s = window.game?.scene?.getScene('{scene}');
+    return page.evaluate("""(scene) => {
+        const s = window.game?.scene?.getScene(scene);
         return s?.buttonNav?.selectedIndex ?? s?.selectedIndex ?? -1;
-    }}""")
+    }""", scene)
+
+
+def snapshot_level(page: Page) -> dict | None:
+    """Read the GameScene level fields the daily-run tests compare, in one evaluate."""
+    return page.evaluate("""() => {
+        const l = window.game?.scene?.getScene('GameScene')?.level;
+        if (!l) return null;
+        return { id: l.id, width: l.width, height: l.height,
+                 targetCoverage: l.targetCoverage, timeLimit: l.timeLimit,
+                 weather: l.weather, isNight: l.isNight, hasWinch: l.hasWinch };
+    }""")
 
 
-def wait_for_selected_index(page: Page, scene: str, expected: int, timeout: int = 5000):
-    page.wait_for_function(f"""() => {{
-        const s = window.game?.scene?.getScene('{scene}');
-        const idx = s?.buttonNav?.selectedIndex ?? s?.selectedIndex ?? -1;
-        return idx === {expected};
-    }}""", timeout=timeout)
+def get_rank(page: Page) -> str | None:
+    return page.evaluate("() => window.game?.scene?.getScene('DailyRunsScene')?.selectedRank")
 
 
-def wait_for_rank(page: Page, expected: str, timeout: int = 5000):
-    page.wait_for_function(f"""() => {{
-        const s = window.game?.scene?.getScene('DailyRunsScene');
-        return s?.selectedRank === '{expected}';
-    }}""", timeout=timeout)
+def wait_for_selected_index(page: Page, scene: str, expected: int, timeout: int = 5000,
+                            msg: str = "Selected index"):
+    """Wait for `scene`'s selection to reach `expected`; fail with `msg` and the actual index.
+
+    Only a timeout costs an extra read, so callers need no re-check afterwards.
+    """
+    try:
+        page.wait_for_function("""([scene, expected]) => {
+            const s = window.game?.scene?.getScene(scene);
+            const idx = s?.buttonNav?.selectedIndex ?? s?.selectedIndex ?? -1;
+            return idx === expected;
+        }""", arg=[scene, expected], timeout=timeout, polling='raf')
+    except PlaywrightTimeout:
+        raise AssertionError(
+            f"{msg}: expected {expected}, got {get_selected_index(page, scene)}") from None
+
+
+def wait_for_rank(page: Page, expected: str, timeout: int = 5000, msg: str = "Rank"):
+    """Wait for the DailyRunsScene rank to become `expected`; fail with `msg` and the actual rank."""
+    try:
+        page.wait_for_function("""(expected) => {
+            const s = window.game?.scene?.getScene('DailyRunsScene');
+            return s?.selectedRank === expected;
+        }""", arg=expected, timeout=timeout, polling='raf')
+    except PlaywrightTimeout:
+        raise AssertionError(f"{msg}: expected {expected}, got {get_rank(page)}") from None
 
 
 def start_daily_run(page: Page, use_gamepad: bool = False):
@@ -97,11 +138,11 @@ def launch_daily_run(page: Page, rank: str = 'red'):
     """
     page.evaluate("() => window.game.scene.start('DailyRunsScene')")
     wait_for_scene(page, "DailyRunsScene", timeout=8000)
-    page.evaluate(f"""() => {{
+    page.evaluate("""(rank) => {
         const drs = window.game.scene.getScene('DailyRunsScene');
-        drs.selectedRank = '{rank}';
+        drs.selectedRank = rank;
         drs.startDailyRun(12345, false);
-    }}""")
+    }""", rank)
     wait_for_scene(page, "GameScene", timeout=10000)
     dismiss_dialogues(page)
 
@@ -115,19 +156,18 @@ def skip_prologue():
     return
 
 
-@pytest.fixture(scope="module")
-def module_context(browser: Browser) -> BrowserContext:
-    """Reuse one context for Daily Runs module to reduce setup overhead."""
-    context = browser.new_context(viewport={"width": 1280, "height": 720})
-    context.add_init_script("localStorage.setItem('snowGroomer_prologueSeen', '1');")
+@pytest.fixture(scope="session")
+def daily_runs_context(browser: Browser) -> BrowserContext:
+    """One context per xdist worker, built with new_game_context."""
+    context = new_game_context(browser, {"width": 1280, "height": 720})
     yield context
     context.close()
 
 
 @pytest.fixture
-def page(module_context: BrowserContext):
+def page(daily_runs_context: BrowserContext):
     """Fresh page per test from a shared context."""
-    p = module_context.new_page()
+    p = daily_runs_context.new_page()
     yield p
     p.evaluate("""() => { try { localStorage.clear(); } catch (_) {} }""")
     p.close()
@@ -154,18 +194,14 @@ class TestDailyRunsKeyboard:
         setup_unlocked(page)
         navigate_to_daily_runs(page)
 
-        rank0 = page.evaluate("() => window.game?.scene?.getScene('DailyRunsScene')?.selectedRank")
+        rank0 = get_rank(page)
         assert rank0 == "green", f"Initial rank should be green, got {rank0}"
 
         page.keyboard.press("ArrowRight")
-        wait_for_rank(page, "blue")
-        rank1 = page.evaluate("() => window.game?.scene?.getScene('DailyRunsScene')?.selectedRank")
-        assert rank1 == "blue", f"Right should cycle to blue, got {rank1}"
+        wait_for_rank(page, "blue", msg="Right should cycle to blue")
 
         page.keyboard.press("ArrowLeft")
-        wait_for_rank(page, "green")
-        rank2 = page.evaluate("() => window.game?.scene?.getScene('DailyRunsScene')?.selectedRank")
-        assert rank2 == "green", f"Left should cycle back to green, got {rank2}"
+        wait_for_rank(page, "green", msg="Left should cycle back to green")
 
     def test_daily_runs_button_nav(self, page: Page):
         setup_unlocked(page)
@@ -176,12 +212,10 @@ class TestDailyRunsKeyboard:
         assert idx == 1, f"Should start on Daily Shift (1), got {idx}"
 
         page.keyboard.press("ArrowDown")
-        wait_for_selected_index(page, "DailyRunsScene", 2)
-        assert get_selected_index(page, "DailyRunsScene") == 2
+        wait_for_selected_index(page, "DailyRunsScene", 2, msg="ArrowDown")
 
         page.keyboard.press("ArrowUp")
-        wait_for_selected_index(page, "DailyRunsScene", 1)
-        assert get_selected_index(page, "DailyRunsScene") == 1
+        wait_for_selected_index(page, "DailyRunsScene", 1, msg="ArrowUp")
 
     def test_daily_runs_enter_starts_game(self, page: Page):
         setup_unlocked(page)
@@ -213,9 +247,8 @@ class TestDailyRunsGamepad:
 
         idx0 = get_selected_index(gamepad_page, "DailyRunsScene")
         tap_gamepad_button(gamepad_page, GP_DPAD_DOWN)
-        wait_for_selected_index(gamepad_page, "DailyRunsScene", idx0 + 1)
-        idx1 = get_selected_index(gamepad_page, "DailyRunsScene")
-        assert idx1 == idx0 + 1, f"Dpad down: {idx0} -> {idx1}"
+        wait_for_selected_index(gamepad_page, "DailyRunsScene", idx0 + 1,
+                                msg=f"Dpad down from {idx0}")
 
     def test_daily_runs_b_goes_back(self, gamepad_page: Page):
         setup_unlocked(gamepad_page)
@@ -245,11 +278,8 @@ class TestDailyRunFlows:
         page.locator("canvas").click()
 
         # Verify daily run level loaded
-        has_session = page.evaluate("""() => {
-            const gs = window.game?.scene?.getScene('GameScene');
-            return gs?.level?.id >= 100;
-        }""")
-        assert has_session, "Daily run level not loaded (id should be >= 100)"
+        level = snapshot_level(page)
+        assert level and level["id"] >= 100, "Daily run level not loaded (id should be >= 100)"
 
         # Pause → Restart
         page.keyboard.press("Escape")
@@ -258,11 +288,8 @@ class TestDailyRunFlows:
         wait_for_scene(page, "GameScene", timeout=10000)
 
         # Daily run session should still be active
-        has_session2 = page.evaluate("""() => {
-            const gs = window.game?.scene?.getScene('GameScene');
-            return gs?.level?.id >= 100;
-        }""")
-        assert has_session2, "Daily run session lost after restart"
+        level = snapshot_level(page)
+        assert level and level["id"] >= 100, "Daily run session lost after restart"
 
     def test_daily_run_completion_no_next_level(self, page: Page):
         """Completing a daily run should NOT show 'Next Level' button."""
@@ -319,14 +346,7 @@ class TestDailyRunLevelGeneration:
         navigate_to_daily_runs(page)
         start_daily_run(page)
 
-        props1 = page.evaluate("""() => {
-            const gs = window.game?.scene?.getScene('GameScene');
-            const l = gs?.level;
-            if (!l) return null;
-            return { id: l.id, width: l.width, height: l.height,
-                     targetCoverage: l.targetCoverage, timeLimit: l.timeLimit,
-                     weather: l.weather, isNight: l.isNight, hasWinch: l.hasWinch };
-        }""")
+        props1 = snapshot_level(page)
         assert props1 is not None, "Level not loaded"
 
         # Quit and restart same daily run
@@ -338,14 +358,7 @@ class TestDailyRunLevelGeneration:
 
         start_daily_run(page)
 
-        props2 = page.evaluate("""() => {
-            const gs = window.game?.scene?.getScene('GameScene');
-            const l = gs?.level;
-            if (!l) return null;
-            return { id: l.id, width: l.width, height: l.height,
-                     targetCoverage: l.targetCoverage, timeLimit: l.timeLimit,
-                     weather: l.weather, isNight: l.isNight, hasWinch: l.hasWinch };
-        }""")
+        props2 = snapshot_level(page)
         assert props1 == props2, f"Daily run not deterministic:\n  run1={props1}\n  run2={props2}"
 
 
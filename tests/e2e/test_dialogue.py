@@ -3,10 +3,15 @@ import pytest
 from playwright.sync_api import Page
 from conftest import (
     wait_for_scene,
-    click_button, assert_scene_active,
+    click_button, assert_scene_active, canvas_box,
     BUTTON_START,
 )
 
+_NEXT_FRAME_DIALOGUE_SHOWING_JS = """() => new Promise(resolve => requestAnimationFrame(() => {
+    const ds = window.game?.scene?.getScene('DialogueScene');
+    resolve(ds?.isShowing === true);  // isDialogueShowing() adds a 200ms ESC cooldown
+}))"""
+
 
 class TestDialogueSystem:
     """Test dialogue display and dismissal."""
@@ -50,11 +55,15 @@ class TestDialogueSystem:
         
         assert_scene_active(game_page, 'DialogueScene')
         
-        canvas = game_page.locator("canvas")
-        box = canvas.bounding_box()
+        # Real clicks so the hit zone stays covered; after each one wait a
+        # single frame for the click to land instead of a fixed 100ms, and
+        # stop as soon as the dialogue has been dismissed.
+        box = canvas_box(game_page)
         for _ in range(10):
             game_page.mouse.click(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
-            game_page.wait_for_timeout(100)
+            showing = game_page.evaluate(_NEXT_FRAME_DIALOGUE_SHOWING_JS)
+            if not showing:
+                break
         
         assert_scene_active(game_page, 'GameScene', "Game should still be running")
 
@@ -42,8 +42,7 @@ def _make_gamepad_fixture(mock_script: str):
             "() => navigator.getGamepads()[0]?.connected === true",
             timeout=3000
         )
-        yield page
-        page.evaluate("window._mockGamepad = null; localStorage.clear()")
+        return page
     return fixture
 
 
@@ -70,10 +69,22 @@ def release_gamepad_button(page: Page, button_index: int):
 
 
 def tap_gamepad_button(page: Page, button_index: int, delay: int = 100):
-    """Press and release a gamepad button with a short delay."""
-    press_gamepad_button(page, button_index)
-    page.wait_for_timeout(delay)
-    release_gamepad_button(page, button_index)
+    """Press and release a gamepad button with a short delay.
+
+    Both transitions run in one async evaluate that resolves after the
+    release, so a following tap still sees a fresh press edge.
+    """
+    page.evaluate("""([index, delay]) => new Promise(resolve => {
+        const gp = window._mockGamepad;
+        if (!gp) return resolve();
+        const set = (down) => {
+            gp.buttons[index].pressed = down;
+            gp.buttons[index].value = down ? 1 : 0;
+            gp.timestamp = performance.now();
+        };
+        set(true);
+        setTimeout(() => { set(false); resolve(); }, delay);
+    })""", [button_index, delay])
 
 
 def navigate_stick_down(page: Page, steps: int = 3):
@@ -3,7 +3,7 @@ import pytest
 from playwright.sync_api import Page
 from conftest import (
     wait_for_scene, skip_to_level, dismiss_dialogues,
-    click_button, get_current_level, assert_scene_active,
+    click_button, get_current_level, assert_scene_active, canvas_box,
     BUTTON_START,
 )
 
@@ -27,8 +27,7 @@ class TestTutorial:
         click_button(game_page, BUTTON_START, "Start Game")
         wait_for_scene(game_page, 'GameScene')
         
-        canvas = game_page.locator("canvas")
-        box = canvas.bounding_box()
+        box = canvas_box(game_page)
         
         game_page.mouse.click(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
         wait_for_scene(game_page, 'GameScene')
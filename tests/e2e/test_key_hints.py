@@ -3,7 +3,7 @@ import pytest
 from playwright.sync_api import Page
 from conftest import (
     wait_for_scene, skip_to_level, wait_for_game_ready,
-    click_button,
+    click_button, canvas_box,
     BUTTON_START,
 )
 
@@ -17,8 +17,7 @@ class TestDynamicKeyHints:
         wait_for_scene(game_page, 'GameScene')
         wait_for_scene(game_page, 'DialogueScene')
         
-        canvas = game_page.locator("canvas")
-        box = canvas.bounding_box()
+        box = canvas_box(game_page)
         
         for _ in range(5):
             game_page.wait_for_timeout(300)
@@ -91,8 +90,7 @@ class TestDynamicKeyHints:
         wait_for_scene(game_page, 'GameScene')
         wait_for_scene(game_page, 'DialogueScene')
         
-        canvas = game_page.locator("canvas")
-        box = canvas.bounding_box()
+        box = canvas_box(game_page)
         
         game_page.wait_for_timeout(300)
         game_page.mouse.click(box["x"] + box["width"] / 2, box["y"] + box["height"] / 2)
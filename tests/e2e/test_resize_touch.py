@@ -12,9 +12,9 @@ import pytest
 from playwright.sync_api import Browser, BrowserContext, Page
 
 from conftest import (
-    GAME_URL,
+    SCENE_TRACKER_JS,
     dismiss_dialogues,
-    wait_for_game_ready,
+    open_game,
 )
 
 # Galaxy Note 10 (narrow portrait — triggers static→follow on L7)
@@ -40,6 +40,7 @@ def touch_context(browser: Browser) -> BrowserContext:
         Object.defineProperty(navigator, 'maxTouchPoints', { get: () => 5 });
         window.ontouchstart = function() {};
     """)
+    context.add_init_script(SCENE_TRACKER_JS)
     yield context
     context.close()
 
@@ -48,9 +49,7 @@ def touch_context(browser: Browser) -> BrowserContext:
 def touch_page(touch_context: BrowserContext):
     """Fresh page per test from a reused context (faster than new context each test)."""
     page = touch_context.new_page()
-    page.goto(GAME_URL)
-    page.wait_for_selector("canvas", timeout=10000)
-    wait_for_game_ready(page)
+    open_game(page)
     yield page
     page.evaluate("localStorage.clear()")
     page.close()
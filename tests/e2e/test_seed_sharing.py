@@ -5,7 +5,8 @@ share button, including locked-state preview for incomplete campaigns.
 """
 from playwright.sync_api import Page
 from conftest import (
-    wait_for_scene, GAME_URL, unlock_all_levels, navigate_to_daily_runs,
+    wait_for_scene, GAME_URL, seed_unlocked_progress, navigate_to_daily_runs,
+    canvas_box,
 )
 from test_daily_runs import setup_unlocked, wait_for_scene_ready
 
@@ -28,8 +29,7 @@ def click_daily_runs_button(page: Page, key: str):
         return {{ x: b.centerX, y: b.centerY }};
     }}""")
     assert pos is not None, f"Button with key '{key}' not found in DailyRunsScene"
-    canvas = page.locator("canvas").bounding_box()
-    assert canvas is not None, "Canvas should be visible"
+    canvas = canvas_box(page)
     page.mouse.click(canvas["x"] + pos["x"], canvas["y"] + pos["y"])
 
 
@@ -100,11 +100,9 @@ def test_shared_seed_locked_escape_goes_back(page: Page):
 
 def test_shared_seed_unlocked_shows_play_button(page: Page):
     """Shared seed with unlocked campaign shows 'Play Shared Seed' button."""
-    # First: unlock, then reload with seed params
+    # Unlock before the first load, which opens the seed URL directly
     page.set_viewport_size({"width": 1280, "height": 720})
-    page.goto(GAME_URL)
-    wait_for_scene(page, "MenuScene", timeout=15000)
-    unlock_all_levels(page)
+    seed_unlocked_progress(page)
     # Now navigate with a seed that differs from today's daily
     # Use a fixed seed that's unlikely to match today's daily
     page.goto(f"{GAME_URL}?seed=ZZZZZ&rank=red")
@@ -122,9 +120,7 @@ def test_shared_seed_unlocked_shows_play_button(page: Page):
 def test_shared_seed_unlocked_sets_rank(page: Page):
     """Shared seed URL with rank=red selects red rank."""
     page.set_viewport_size({"width": 1280, "height": 720})
-    page.goto(GAME_URL)
-    wait_for_scene(page, "MenuScene", timeout=15000)
-    unlock_all_levels(page)
+    seed_unlocked_progress(page)
     page.goto(f"{GAME_URL}?seed=ZZZZZ&rank=red")
     wait_for_scene(page, "DailyRunsScene", timeout=15000)
     wait_for_scene_ready(page, "DailyRunsScene")
@@ -138,9 +134,7 @@ def test_shared_seed_unlocked_sets_rank(page: Page):
 def test_shared_seed_starts_game(page: Page):
     """Clicking shared seed button starts GameScene with the shared level."""
     page.set_viewport_size({"width": 1280, "height": 720})
-    page.goto(GAME_URL)
-    wait_for_scene(page, "MenuScene", timeout=15000)
-    unlock_all_levels(page)
+    seed_unlocked_progress(page)
     page.goto(f"{GAME_URL}?seed=ZZZZZ&rank=blue")
     wait_for_scene(page, "DailyRunsScene", timeout=15000)
     wait_for_scene_ready(page, "DailyRunsScene")
@@ -223,9 +217,7 @@ def test_seed_code_displayed_on_daily_runs(page: Page):
 def test_seed_determinism_via_url(page: Page):
     """Same seed+rank always generates the same piste name."""
     page.set_viewport_size({"width": 1280, "height": 720})
-    page.goto(GAME_URL)
-    wait_for_scene(page, "MenuScene", timeout=15000)
-    unlock_all_levels(page)
+    seed_unlocked_progress(page)
 
     names = []
     for _ in range(2):
@@ -3,7 +3,7 @@ import pytest
 from playwright.sync_api import Page, expect
 from conftest import (
     wait_for_scene, wait_for_game_ready, GAME_URL,
-    navigate_to_settings, get_active_scenes, assert_scene_active,
+    navigate_to_settings, get_active_scenes, assert_scene_active, canvas_box,
 )
 
 
@@ -135,8 +135,7 @@ class TestSettingsLayout:
             return null;
         }""")
         assert result is not None, "No clickable toggle buttons found in Settings"
-        canvas = settings_page.locator("canvas").bounding_box()
-        assert canvas is not None
+        canvas = canvas_box(settings_page)
         settings_page.mouse.click(canvas["x"] + result["x"], canvas["y"] + result["y"])
         assert_scene_active(settings_page, 'SettingsScene')
 
@@ -157,8 +156,7 @@ class TestSettingsLayout:
             return null;
         }""")
         assert pos is not None, "Back button should be clickable"
-        canvas = settings_page.locator("canvas").bounding_box()
-        assert canvas is not None
+        canvas = canvas_box(settings_page)
         settings_page.mouse.click(canvas["x"] + pos["x"], canvas["y"] + pos["y"])
         wait_for_scene(settings_page, 'MenuScene')
 
@@ -3,7 +3,7 @@ import pytest
 from playwright.sync_api import Page
 from conftest import (
     wait_for_scene, click_button, get_active_scenes, find_menu_button_index,
-    assert_scene_active, wait_for_input_ready, BUTTON_START, GAME_URL, wait_for_game_ready,
+    assert_scene_active, wait_for_input_ready, BUTTON_START, open_game,
 )
 
 
@@ -79,7 +79,7 @@ class TestSkiRun:
 
         # Click "Skip Run" by data key
         skip_idx = find_menu_button_index(game_page, 'skipRun', 'PauseScene')
-        click_button(game_page, skip_idx, "Skip Run")
+        click_button(game_page, skip_idx, "Skip Run", scene_name='PauseScene')
         wait_for_scene(game_page, 'LevelCompleteScene', timeout=10000)
         assert_scene_active(game_page, 'LevelCompleteScene',
                             "Skip Run should return to LevelCompleteScene")
@@ -312,11 +312,8 @@ class TestSkiTouchControls:
             Object.defineProperty(navigator, 'maxTouchPoints', { get: () => 5 });
             window.ontouchstart = function() {};
         """)
-        page.goto(GAME_URL)
-        page.wait_for_selector("canvas", timeout=10000)
-        wait_for_game_ready(page)
-        yield page
-        page.evaluate("localStorage.clear()")
+        open_game(page)
+        return page
 
     def test_touch_controls_present_in_ski_scene(self, touch_game: Page):
         """Touch device should show joystick and brake button via HUDScene in ski mode."""
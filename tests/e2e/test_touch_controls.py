@@ -7,7 +7,7 @@ import pytest
 from playwright.sync_api import Page, expect, TimeoutError as PlaywrightTimeout
 
 # Import the base URL from conftest
-from conftest import GAME_URL, skip_to_level, dismiss_dialogues, wait_for_scene, wait_for_game_ready
+from conftest import open_game, skip_to_level, dismiss_dialogues, wait_for_scene, canvas_box
 
 # Standard mobile viewport sizes
 IPHONE_PORTRAIT = {"width": 390, "height": 844}
@@ -15,7 +15,7 @@ IPHONE_LANDSCAPE = {"width": 844, "height": 390}
 
 def click_start_button(page: Page):
     """Click the Start Game button by querying its screen position from the game scene."""
-    box = page.locator("canvas").bounding_box()
+    box = canvas_box(page)
     
     pos = page.evaluate("""() => {
         const scene = window.game?.scene?.getScene('MenuScene');
@@ -49,12 +49,8 @@ def touch_page(page: Page):
     """)
     
     # Navigate and wait for game to load
-    page.goto(GAME_URL)
-    page.wait_for_selector("canvas", timeout=10000)
-    wait_for_game_ready(page)
-    
-    yield page
-    page.evaluate("localStorage.clear()")
+    open_game(page)
+    return page
 
 
 def test_touch_controls_visible_on_touch_device(touch_page: Page):
@@ -290,9 +286,7 @@ class TestOrientationChanges:
     def test_portrait_to_landscape_resize(self, page: Page):
         """Game should resize when switching from portrait to landscape."""
         page.set_viewport_size(IPHONE_PORTRAIT)
-        page.goto(GAME_URL)
-        page.wait_for_selector("canvas", timeout=10000)
-        wait_for_game_ready(page)
+        open_game(page)
         
         # Switch to landscape and wait for resize to propagate
         page.set_viewport_size(IPHONE_LANDSCAPE)
@@ -305,9 +299,7 @@ class TestOrientationChanges:
     def test_landscape_to_portrait_resize(self, page: Page):
         """Game should resize when switching from landscape to portrait."""
         page.set_viewport_size(IPHONE_LANDSCAPE)
-        page.goto(GAME_URL)
-        page.wait_for_selector("canvas", timeout=10000)
-        wait_for_game_ready(page)
+        open_game(page)
         
         # Switch to portrait and wait for resize to propagate
         page.set_viewport_size(IPHONE_PORTRAIT)
@@ -321,9 +313,7 @@ class TestOrientationChanges:
         """Game should remain playable after orientation change."""
         # Start in portrait
         page.set_viewport_size(IPHONE_PORTRAIT)
-        page.goto(GAME_URL)
-        page.wait_for_selector("canvas", timeout=10000)
-        wait_for_game_ready(page)
+        open_game(page)
         
         # Click to start game (calculate button position for small screen)
         click_start_button(page)
@@ -1,7 +1,7 @@
 """E2E tests for the volume indicator on the menu screen."""
 import pytest
 from playwright.sync_api import Page
-from conftest import wait_for_game_ready, assert_scene_active
+from conftest import wait_for_game_ready, assert_scene_active, canvas_box
 
 
 def get_volume_indicator_pos(page):
@@ -25,9 +25,7 @@ def get_audio_state(page):
 
 def click_volume_icon(page):
     """Click the volume indicator icon on the canvas."""
-    canvas = page.locator("canvas")
-    box = canvas.bounding_box()
-    assert box, "Canvas not found"
+    box = canvas_box(page)
     pos = get_volume_indicator_pos(page)
     assert pos, "Volume indicator not found"
     # Click center of icon
@@ -106,7 +104,7 @@ class TestVolumeIndicator:
         """Hovering over the icon shows the volume slider (mouse only)."""
         assert_scene_active(game_page, 'MenuScene')
 
-        canvas = page_canvas_box(game_page)
+        canvas = canvas_box(game_page)
         pos = get_volume_indicator_pos(game_page)
         assert pos is not None
 
@@ -125,7 +123,7 @@ class TestVolumeIndicator:
         """Slider disappears when pointer leaves the area."""
         assert_scene_active(game_page, 'MenuScene')
 
-        canvas = page_canvas_box(game_page)
+        canvas = canvas_box(game_page)
         pos = get_volume_indicator_pos(game_page)
         assert pos is not None
 
@@ -171,11 +169,3 @@ class TestVolumeIndicator:
             return scene?.volumeMuteOverlay != null;
         }""")
         assert overlay_after, "Overlay should appear when muted"
-
-
-def page_canvas_box(page):
-    """Get the canvas bounding box."""
-    canvas = page.locator("canvas")
-    box = canvas.bounding_box()
-    assert box, "Canvas not found"
-    return box
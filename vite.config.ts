@@ -115,6 +115,11 @@ export default defineConfig(({ mode }) => {
     port: parseInt(env.PORT || '3000'),
     strictPort: true,
     open: false,
+    // Pre-transform the app's import graph at startup so the first page
+    // loads (e.g. 7 parallel E2E workers) don't each wait on it
+    warmup: {
+      clientFiles: ['./src/main.ts'],
+    },
   },
   resolve: {
     alias: {